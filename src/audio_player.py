@@ -21,6 +21,18 @@ class AudioPlayer:
     def __init__(self) -> None:
         logger.info("AudioPlayer initialized")
         self._player = LocalAudioPlayer() if LocalAudioPlayer else None
+        # File playback helper, resolved once on first use (None if unavailable).
+        self._file_player: Any = None
+        self._file_player_resolved = False
+
+    def _get_file_player(self) -> Any:
+        """Look up the file playback helper once and cache the result."""
+        if not self._file_player_resolved:
+            self._file_player = getattr(openai_audio, "play", None)
+            self._file_player_resolved = True
+            if self._file_player is None:
+                logger.error("No file playback helper available in openai.audio")
+        return self._file_player
 
     async def play(self, source: Union[str, Path, Any]) -> bool:
         """Play audio from a file path or OpenAI response object."""
@@ -29,7 +41,11 @@ class AudioPlayer:
             return False
         try:
             if isinstance(source, (str, Path)):
-                result = openai_audio.play(str(source))
+                play_file = self._get_file_player()
+                if play_file is None:
+                    return False
+                # The helper may block until playback ends, so keep it off the event loop.
+                result = await asyncio.to_thread(play_file, str(source))
                 if asyncio.iscoroutine(result):
                     await result
                 return True
@@ -8,21 +8,50 @@ Phase 3: パフォーマンス最適化
 - メモリとディスクのハイブリッドキャッシュ
 """
 
+import asyncio
 import hashlib
 import json
-import pickle
+import os
+import shutil
+import struct
 import time
-from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import logging
 
+# orjsonはオプション（未インストール時は標準のjsonを使用）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# BLAKE3はオプション（未インストール時はSHA-256にフォールバック）
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 logger = logging.getLogger(__name__)
 
+# 単調時計とUnix時刻の差（起動時に1回だけ記録し、永続化時の変換に使用）
+_WALL_CLOCK_OFFSET = time.time() - time.monotonic()
+
+# 何回のgetごとにキャッシュファイルの存在を再確認するか
+CACHE_VERIFY_INTERVAL = 1000
+
+# メタデータに無いキャッシュファイルを孤立とみなすまでの経過時間（秒）
+# （他プロセスが配置して登録する前のファイルを消さないための猶予）
+ORPHAN_GRACE_SECONDS = 600
+
+# キャッシュキーのハッシュ長（16進32文字 = 128bit）
+CACHE_KEY_HEX_LENGTH = 32
+
 
 class TTSCacheKey:
     """TTSキャッシュのキークラス"""
     
+    __slots__ = ('text', 'voice', 'speed', 'response_format', 'instructions', '_hash')
+    
     def __init__(
         self,
         text: str,
@@ -46,50 +75,142 @@ class TTSCacheKey:
         self.speed = speed
         self.response_format = response_format
         self.instructions = instructions
+        self._hash: Optional[str] = None
     
     def to_hash(self) -> str:
-        """キャッシュキーをハッシュ値に変換"""
-        # パラメータを正規化してハッシュ化
-        key_data = {
-            "text": self.text.strip(),
-            "voice": self.voice,
-            "speed": round(self.speed, 2),  # 浮動小数点の精度を統一
-            "response_format": self.response_format,
-            "instructions": self.instructions.strip() if self.instructions else None
-        }
+        """キャッシュキーをハッシュ値に変換（計算結果はインスタンスにキャッシュ）"""
+        if self._hash is not None:
+            return self._hash
+        
+        # 各フィールドを正規化し、NUL区切りで直接ハッシュに流し込む
+        hasher = blake3.blake3() if blake3 is not None else hashlib.sha256()
+        hasher.update(self.text.strip().encode('utf-8'))
+        hasher.update(b'\x00')
+        hasher.update(self.voice.encode('utf-8'))
+        hasher.update(b'\x00')
+        hasher.update(struct.pack('<d', round(self.speed, 2)))  # 浮動小数点の精度を統一
+        hasher.update(b'\x00')
+        hasher.update(self.response_format.encode('utf-8'))
+        hasher.update(b'\x00')
+        hasher.update((self.instructions or '').strip().encode('utf-8'))
         
-        # JSON文字列にして安定したハッシュを生成
-        key_str = json.dumps(key_data, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(key_str.encode('utf-8')).hexdigest()
+        if blake3 is not None:
+            self._hash = hasher.hexdigest(length=CACHE_KEY_HEX_LENGTH // 2)
+        else:
+            self._hash = hasher.hexdigest()[:CACHE_KEY_HEX_LENGTH]
+        return self._hash
     
     def __str__(self) -> str:
         return f"TTSCacheKey({self.to_hash()[:12]}...)"
 
 
+def _json_dumps(obj: Any) -> bytes:
+    """メタデータをコンパクトなJSONバイト列にシリアライズ"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """JSONバイト列をデシリアライズ"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _unlink_files(paths: List[str]) -> None:
+    """
+    複数ファイルをまとめて削除
+    
+    io_uringによる一括unlinkは採用しない（PythonバインディングのAPIがリリース間で
+    互換性なく変わるうえ、投入中のパスバッファの寿命管理が必要になるため）。
+    
+    Args:
+        paths: 削除するファイルパスのリスト
+    """
+    for path in paths:
+        try:
+            Path(path).unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Failed to delete cached file {path}: {e}")
+
+
+def _to_monotonic(wall_clock: float) -> float:
+    """永続化されたUnix時刻を単調時計の値に変換"""
+    return wall_clock - _WALL_CLOCK_OFFSET
+
+
+def _to_wall_clock(monotonic: float) -> float:
+    """単調時計の値を永続化用のUnix時刻に変換"""
+    return monotonic + _WALL_CLOCK_OFFSET
+
+
+def _copy_file_range_chunk(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """copy_file_rangeで指定オフセットから最大countバイトをカーネル内コピー"""
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile_chunk(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """sendfileで指定オフセットから最大countバイトをカーネル内コピー"""
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _modified_before(path: str, cutoff: float) -> bool:
+    """ファイルの更新時刻がcutoff（Unix時刻）より前かどうか（stat失敗時はFalse）"""
+    try:
+        return os.stat(path).st_mtime < cutoff
+    except OSError:
+        return False
+
+
+def _is_cache_file_name(name: str) -> bool:
+    """`{キーハッシュ}{拡張子}` 形式のキャッシュファイル名かどうか"""
+    stem, dot, extension = name.partition('.')
+    return (
+        bool(dot and extension)
+        and len(stem) == CACHE_KEY_HEX_LENGTH
+        and all(c in '0123456789abcdef' for c in stem)
+    )
+
+
+class _InflightGeneration:
+    """進行中の生成タスクと、その結果を待っている呼び出し元の数"""
+    
+    __slots__ = ('task', 'waiters')
+    
+    def __init__(self, task: "asyncio.Task[str]"):
+        self.task = task
+        self.waiters = 0
+        # 待機者がいなくなった後に失敗した場合の未取得例外の警告を抑止
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
 class CacheEntry:
     """キャッシュエントリークラス"""
     
-    def __init__(self, file_path: str, created_at: float = None):
+    def __init__(self, file_path: str, created_at: float = None, size_bytes: int = 0):
         """
         キャッシュエントリーを初期化
         
         Args:
             file_path: 音声ファイルのパス
-            created_at: 作成時刻（Unix timestamp）
+            created_at: 作成時刻（time.monotonic()基準）
+            size_bytes: ファイルサイズ（バイト）
         """
         self.file_path = file_path
-        self.created_at = created_at or time.time()
+        self.created_at = created_at if created_at is not None else time.monotonic()
+        self.size_bytes = size_bytes
         self.access_count = 0
         self.last_accessed = self.created_at
     
     def touch(self) -> None:
         """アクセス情報を更新"""
         self.access_count += 1
-        self.last_accessed = time.time()
+        self.last_accessed = time.monotonic()
     
     def is_expired(self, ttl_seconds: float) -> bool:
         """TTLに基づく期限切れチェック"""
-        return (time.time() - self.created_at) > ttl_seconds
+        return (time.monotonic() - self.created_at) > ttl_seconds
     
     def exists(self) -> bool:
         """ファイルが実際に存在するかチェック"""
@@ -97,7 +218,13 @@ class CacheEntry:
 
 
 class TTSCache:
-    """TTS音声キャッシュシステム"""
+    """
+    TTS音声キャッシュシステム
+    
+    インデックス（_cache）とジャーナルはイベントループのスレッドからのみ更新する。
+    put_asyncもファイル配置だけをスレッドプールに逃がし、登録はループ上で行うため、
+    ロックやシャーディングは不要で、LRU順序はキャッシュ全体で厳密に保たれる。
+    """
     
     def __init__(
         self,
@@ -118,97 +245,360 @@ class TTSCache:
         self.cache_dir = cache_dir or Path.home() / ".cache" / "openai-tts-mcp" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # LRUキャッシュ（メモリ内のメタデータ）
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # LRUキャッシュ（メモリ内のメタデータ、dictの挿入順をLRU順として使用）
+        self._cache: Dict[str, CacheEntry] = {}
+        
+        # キャッシュファイルの合計サイズ（追加・削除時に増減）
+        self._total_size = 0
         
-        # キャッシュメタデータファイル
+        # キャッシュメタデータファイル（スナップショット + 追記型ジャーナル）
         self.metadata_file = self.cache_dir / "cache_metadata.json"
+        self.journal_file = self.cache_dir / "cache_metadata.jsonl"
+        self._journal_fh = None
+        self._journal_lines = 0
+        
+        # 非同期書き込み用のバックグラウンドライター（put_asyncの初回呼び出しで起動）
+        self._writer_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        
+        # 生成中のキー（同一キーの同時ミスを1回のAPI呼び出しにまとめる）
+        self._inflight: Dict[str, "_InflightGeneration"] = {}
         
         # 統計情報
         self.hits = 0
         self.misses = 0
+        self._gets_since_verify = 0
         
         # 初期化時にメタデータを読み込み
         self._load_metadata()
-        self._cleanup_expired()
+        self._cleanup_expired(remove_orphans=True)
     
     def _load_metadata(self) -> None:
-        """キャッシュメタデータを読み込み"""
-        if not self.metadata_file.exists():
+        """キャッシュメタデータを読み込み（スナップショット + ジャーナル再生）"""
+        if not self.metadata_file.exists() and not self.journal_file.exists():
             return
         
         try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            metadata: Dict[str, Dict[str, Any]] = {}
+            if self.metadata_file.exists():
+                with open(self.metadata_file, 'rb') as f:
+                    metadata = _json_loads(f.read())
+            
+            # ジャーナルを順に適用（末尾の書きかけ行は無視）
+            if self.journal_file.exists():
+                with open(self.journal_file, 'r+b') as f:
+                    data = f.read()
+                    if data and not data.endswith(b"\n"):
+                        # 追記中のクラッシュで残った書きかけ行を切り詰める
+                        # （残すと次の追記がその後ろに連結され、有効なレコードまで失われる）
+                        data = data[:data.rfind(b"\n") + 1]
+                        f.truncate(len(data))
+                        logger.warning("Truncated a partial record at the end of the cache journal")
+                    for line in data.split(b"\n"):
+                        if not line:
+                            continue
+                        try:
+                            record = _json_loads(line)
+                        except ValueError:
+                            continue
+                        self._journal_lines += 1
+                        self._apply_journal_record(metadata, record)
             
             for key, entry_data in metadata.items():
                 entry = CacheEntry(
                     file_path=entry_data["file_path"],
-                    created_at=entry_data["created_at"]
+                    created_at=_to_monotonic(entry_data["created_at"]),
+                    size_bytes=entry_data.get("size_bytes", 0)
                 )
                 entry.access_count = entry_data.get("access_count", 0)
-                entry.last_accessed = entry_data.get("last_accessed", entry.created_at)
+                if "last_accessed" in entry_data:
+                    entry.last_accessed = _to_monotonic(entry_data["last_accessed"])
                 
-                # ファイルが実際に存在し、期限切れでない場合のみ復元
-                if entry.exists() and not entry.is_expired(self.ttl_seconds):
+                # ファイルの存在確認とサイズの確定は直後の_cleanup_expiredで一括実施
+                if not entry.is_expired(self.ttl_seconds):
                     self._cache[key] = entry
+                    self._total_size += entry.size_bytes
             
             logger.info(f"Loaded {len(self._cache)} cache entries from metadata")
             
         except Exception as e:
             logger.warning(f"Failed to load cache metadata: {e}")
             # メタデータファイルが破損している場合は削除
+            self._cache.clear()
+            self._total_size = 0
+            self._journal_lines = 0
             self.metadata_file.unlink(missing_ok=True)
+            self.journal_file.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _apply_journal_record(metadata: Dict[str, Dict[str, Any]], record: Dict[str, Any]) -> None:
+        """ジャーナルの1レコードをメタデータに適用（LRU順序も再現）"""
+        op = record.get("op")
+        key = record.get("k")
+        
+        if op == "put":
+            metadata.pop(key, None)
+            metadata[key] = {
+                "file_path": record["file_path"],
+                "created_at": record["created_at"],
+                "access_count": record.get("access_count", 0),
+                "last_accessed": record.get("last_accessed", record["created_at"]),
+                "size_bytes": record.get("size_bytes", 0)
+            }
+        elif op == "touch":
+            entry_data = metadata.pop(key, None)
+            if entry_data is not None:
+                entry_data["access_count"] = record.get("access_count", entry_data.get("access_count", 0))
+                entry_data["last_accessed"] = record.get("last_accessed", entry_data.get("last_accessed"))
+                metadata[key] = entry_data
+        elif op == "del":
+            metadata.pop(key, None)
     
     def _save_metadata(self) -> None:
-        """キャッシュメタデータを保存"""
+        """キャッシュメタデータのスナップショットを保存し、ジャーナルを切り詰める"""
         try:
             metadata = {}
             for key, entry in self._cache.items():
                 metadata[key] = {
                     "file_path": entry.file_path,
-                    "created_at": entry.created_at,
+                    "created_at": _to_wall_clock(entry.created_at),
                     "access_count": entry.access_count,
-                    "last_accessed": entry.last_accessed
+                    "last_accessed": _to_wall_clock(entry.last_accessed),
+                    "size_bytes": entry.size_bytes
                 }
             
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            # 一時ファイルに書いてから置き換え（書き込み途中のクラッシュでインデックスを失わない）
+            temp_file = self.metadata_file.with_name(self.metadata_file.name + ".tmp")
+            with open(temp_file, 'wb') as f:
+                f.write(_json_dumps(metadata))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.metadata_file)
+            
+            # スナップショットに取り込まれたジャーナルは不要
+            self._close_journal()
+            self.journal_file.unlink(missing_ok=True)
+            self._journal_lines = 0
             
         except Exception as e:
             logger.warning(f"Failed to save cache metadata: {e}")
     
-    def _cleanup_expired(self) -> None:
-        """期限切れエントリーの削除"""
+    def _append_metadata(self, record: Dict[str, Any], flush: bool = True) -> None:
+        """
+        メタデータの変更をジャーナルに1行追記
+        
+        putごとに全エントリーを書き直す代わりに、変更分だけを O(1) で記録する。
+        
+        Args:
+            record: ジャーナルレコード（op: put/touch/del, k: キーハッシュ）
+            flush: 追記後すぐにディスクへフラッシュするか
+        """
+        try:
+            if self._journal_fh is None:
+                self._journal_fh = open(self.journal_file, 'ab', buffering=1 << 16)
+            self._journal_fh.write(_json_dumps(record) + b"\n")
+            if flush:
+                self._journal_fh.flush()
+            self._journal_lines += 1
+        except Exception as e:
+            logger.warning(f"Failed to append cache metadata: {e}")
+    
+    def _flush_journal(self) -> None:
+        """バッファ済みのジャーナルをディスクへフラッシュ"""
+        if self._journal_fh is not None:
+            try:
+                self._journal_fh.flush()
+            except Exception as e:
+                logger.warning(f"Failed to flush cache metadata: {e}")
+    
+    def _append_entry(self, key: str, entry: "CacheEntry", flush: bool = True) -> None:
+        """エントリーの追加をジャーナルに記録"""
+        self._append_metadata({
+            "op": "put",
+            "k": key,
+            "file_path": entry.file_path,
+            "created_at": _to_wall_clock(entry.created_at),
+            "access_count": entry.access_count,
+            "last_accessed": _to_wall_clock(entry.last_accessed),
+            "size_bytes": entry.size_bytes
+        }, flush=flush)
+    
+    def _close_journal(self) -> None:
+        """ジャーナルのファイルハンドルを閉じる"""
+        if self._journal_fh is not None:
+            try:
+                self._journal_fh.close()
+            except Exception:
+                pass
+            self._journal_fh = None
+    
+    def _compact_if_needed(self) -> None:
+        """ジャーナルが閾値（max_sizeの4倍）を超えたらスナップショットに圧縮"""
+        if self._journal_lines > 4 * self.max_size:
+            logger.debug(f"Compacting cache metadata journal ({self._journal_lines} lines)")
+            self._save_metadata()
+    
+    def _cleanup_expired(self, remove_orphans: bool = False) -> None:
+        """
+        期限切れ・ファイル消失エントリーの削除（ファイルサイズも再集計）
+        
+        Args:
+            remove_orphans: メタデータに無いキャッシュファイルも削除するか
+                （クラッシュで記録されずに残ったファイルの回収用。配置済み・登録前の
+                ファイルを消さないよう、書き込みが走っていない起動時にのみ指定する。
+                他プロセスが配置中のファイルを避けるため、更新から
+                ORPHAN_GRACE_SECONDS 経過したものだけを対象とする）
+        """
         expired_keys = []
+        expired_files = []
+        total_size = 0
+        
+        # ディレクトリを1回走査して、存在するファイルとサイズをまとめて取得
+        present = self._scan_cache_files()
+        cache_dir = str(self.cache_dir)
         
         for key, entry in self._cache.items():
-            if entry.is_expired(self.ttl_seconds) or not entry.exists():
-                expired_keys.append(key)
-                # ファイルも削除
+            if os.path.dirname(entry.file_path) == cache_dir:
+                size_bytes = present.get(os.path.basename(entry.file_path))
+            else:
                 try:
-                    Path(entry.file_path).unlink(missing_ok=True)
-                except Exception as e:
-                    logger.warning(f"Failed to delete cached file {entry.file_path}: {e}")
+                    size_bytes = os.stat(entry.file_path).st_size
+                except OSError:
+                    size_bytes = None
+            
+            if size_bytes is None or entry.is_expired(self.ttl_seconds):
+                expired_keys.append(key)
+                expired_files.append(entry.file_path)
+            else:
+                entry.size_bytes = size_bytes
+                total_size += size_bytes
+        
+        if remove_orphans:
+            referenced = {
+                os.path.basename(entry.file_path)
+                for entry in self._cache.values()
+                if os.path.dirname(entry.file_path) == cache_dir
+            }
+            orphan_files = [
+                os.path.join(cache_dir, name)
+                for name in present
+                if name not in referenced and _is_cache_file_name(name)
+            ]
+            cutoff = time.time() - ORPHAN_GRACE_SECONDS
+            orphan_files = [path for path in orphan_files if _modified_before(path, cutoff)]
+            if orphan_files:
+                logger.info(f"Removing {len(orphan_files)} orphaned cache files")
+                expired_files.extend(orphan_files)
+        
+        # ファイルもまとめて削除
+        _unlink_files(expired_files)
         
         for key in expired_keys:
             del self._cache[key]
+        self._total_size = total_size
         
         if expired_keys:
             logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
             self._save_metadata()
     
+    def _scan_cache_files(self) -> Dict[str, int]:
+        """
+        キャッシュディレクトリ内のファイル名とサイズを取得
+        
+        Returns:
+            Dict[str, int]: ファイル名とサイズ（バイト）のマッピング
+        """
+        present = {}
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for dir_entry in it:
+                    if dir_entry.is_file(follow_symlinks=False):
+                        present[dir_entry.name] = dir_entry.stat(follow_symlinks=False).st_size
+        except OSError as e:
+            logger.warning(f"Failed to scan cache directory: {e}")
+        return present
+    
+    def _verify(self) -> None:
+        """キャッシュファイルの存在を再確認し、消えたエントリーを除去"""
+        self._gets_since_verify = 0
+        self._cleanup_expired()
+    
     def _evict_lru(self) -> None:
         """LRUエントリーを削除してスペースを確保"""
         if len(self._cache) >= self.max_size:
             # 最も古いエントリーを削除
-            key, entry = self._cache.popitem(last=False)
+            key = next(iter(self._cache))
+            entry = self._cache.pop(key)
+            self._total_size -= entry.size_bytes
+            self._append_metadata({"op": "del", "k": key})
             try:
                 Path(entry.file_path).unlink(missing_ok=True)
                 logger.debug(f"Evicted LRU cache entry: {key}")
             except Exception as e:
                 logger.warning(f"Failed to delete evicted file {entry.file_path}: {e}")
     
+    def _place_file(self, source_path: Path, cache_file_path: Path, size: int) -> None:
+        """
+        キャッシュファイルを配置
+        
+        ソースが既にキャッシュディレクトリ内にある場合はコピーせず、
+        名前が異なればrename（同一FS上でアトミック）するだけで登録する。
+        
+        Args:
+            source_path: コピー元のファイルパス
+            cache_file_path: キャッシュファイルのパス
+            size: コピー元のファイルサイズ（バイト）
+        """
+        if source_path.parent == self.cache_dir:
+            if source_path.name != cache_file_path.name:
+                os.replace(source_path, cache_file_path)
+            return
+        
+        self._link_or_copy(source_path, cache_file_path, size)
+    
+    @staticmethod
+    def _link_or_copy(source_path: Path, dest_path: Path, size: int) -> None:
+        """
+        ソースファイルをキャッシュディレクトリへ配置
+        
+        同一ファイルシステムであればハードリンク（コピーなし）、それ以外は
+        copy_file_range（reflink対応FSではO(1)）→ sendfile → 通常コピーの順で試行する。
+        
+        Args:
+            source_path: コピー元のファイルパス
+            dest_path: キャッシュファイルのパス
+            size: コピー元のファイルサイズ（バイト）
+        """
+        dest_path.unlink(missing_ok=True)
+        try:
+            os.link(source_path, dest_path)
+            return
+        except (OSError, NotImplementedError):
+            pass
+        
+        with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            
+            for copy_chunk in (_copy_file_range_chunk, _sendfile_chunk):
+                try:
+                    offset = 0
+                    while offset < size:
+                        copied = copy_chunk(src_fd, dst_fd, offset, size - offset)
+                        if copied == 0:
+                            break
+                        offset += copied
+                    if offset == size:
+                        return
+                except (OSError, AttributeError):
+                    # 古いカーネルや非Linux環境では次の方式へ
+                    pass
+                # 途中で0が返った場合も切り詰めて次の方式へ（不完全なファイルを残さない）
+                dst.truncate(0)
+            
+            src.seek(0)
+            dst.seek(0)
+            shutil.copyfileobj(src, dst)
+    
     def get(self, cache_key: TTSCacheKey) -> Optional[str]:
         """
         キャッシュから音声ファイルを取得
@@ -221,12 +611,19 @@ class TTSCache:
         """
         key_hash = cache_key.to_hash()
         
+        # ファイルの存在確認は毎回行わず、一定回数ごとにまとめて検証
+        self._gets_since_verify += 1
+        if self._gets_since_verify >= CACHE_VERIFY_INTERVAL:
+            self._verify()
+        
         if key_hash in self._cache:
             entry = self._cache[key_hash]
             
-            # 期限切れチェック
-            if entry.is_expired(self.ttl_seconds) or not entry.exists():
+            # 期限切れチェック（キャッシュディレクトリは自前管理のためstatは省略）
+            if entry.is_expired(self.ttl_seconds):
                 del self._cache[key_hash]
+                self._total_size -= entry.size_bytes
+                self._append_metadata({"op": "del", "k": key_hash})
                 try:
                     Path(entry.file_path).unlink(missing_ok=True)
                 except Exception:
@@ -236,7 +633,16 @@ class TTSCache:
             
             # アクセス情報更新（LRUのために末尾に移動）
             entry.touch()
-            self._cache.move_to_end(key_hash)
+            self._cache[key_hash] = self._cache.pop(key_hash)
+            
+            # ヒットごとの書き込みを避けるため、アクセス回数が2の冪のときだけ記録
+            if entry.access_count & (entry.access_count - 1) == 0:
+                self._append_metadata({
+                    "op": "touch",
+                    "k": key_hash,
+                    "access_count": entry.access_count,
+                    "last_accessed": _to_wall_clock(entry.last_accessed)
+                })
             
             self.hits += 1
             logger.debug(f"Cache hit: {cache_key}")
@@ -246,59 +652,230 @@ class TTSCache:
         logger.debug(f"Cache miss: {cache_key}")
         return None
     
+    async def get_or_compute(
+        self,
+        cache_key: TTSCacheKey,
+        compute: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        キャッシュから取得し、無ければ生成してキャッシュに保存
+        
+        同じキーの生成が進行中の場合は新たに生成せず、その結果を待つ。
+        生成は待機者が1人でも残っている間は継続し、全員がキャンセルされた場合のみ中止する。
+        
+        Args:
+            cache_key: キャッシュキー
+            compute: 音声ファイルを生成してパスを返すコルーチン関数
+            
+        Returns:
+            str: 音声ファイルのパス
+        """
+        cached_path = self.get(cache_key)
+        if cached_path:
+            return cached_path
+        
+        key_hash = cache_key.to_hash()
+        inflight = self._inflight.get(key_hash)
+        if inflight is None:
+            # 生成は最初の呼び出し元ではなくキャッシュが所有するタスクで実行する
+            # （最初の呼び出し元がキャンセルされても、他の待機者の結果は失われない）
+            inflight = _InflightGeneration(
+                asyncio.create_task(self._compute_and_store(key_hash, cache_key, compute))
+            )
+            self._inflight[key_hash] = inflight
+        else:
+            logger.debug(f"Waiting for in-flight generation: {cache_key}")
+        
+        task = inflight.task
+        inflight.waiters += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            inflight.waiters -= 1
+            if inflight.waiters == 0 and not task.done():
+                # 待機者が全員キャンセルされた場合のみ生成を中止し、以降の呼び出しは新たに生成する
+                if self._inflight.get(key_hash) is inflight:
+                    del self._inflight[key_hash]
+                task.cancel()
+    
+    async def _compute_and_store(
+        self,
+        key_hash: str,
+        cache_key: TTSCacheKey,
+        compute: Callable[[], Awaitable[str]]
+    ) -> str:
+        """音声ファイルを生成してキャッシュに保存（get_or_compute の生成タスク本体）"""
+        task = asyncio.current_task()
+        try:
+            file_path = await compute()
+            # 登録が終わるまで_inflightに残す（ライターのキュー経由だと、登録前の同一キーの
+            # 呼び出しがキャッシュと_inflightの両方を外して生成を重複させる）
+            await self._put_now(cache_key, file_path)
+            return file_path
+        finally:
+            inflight = self._inflight.get(key_hash)
+            if inflight is not None and inflight.task is task:
+                del self._inflight[key_hash]
+    
     def put(self, cache_key: TTSCacheKey, file_path: str) -> None:
         """
         音声ファイルをキャッシュに保存
         
+        同一ファイルシステム上ではハードリンクで登録するため、
+        呼び出し側はput後にソースファイルの内容を書き換えないこと。
+        ソースがキャッシュディレクトリ内にある場合はコピーせずにrenameで登録する
+        （ファイル名が `{キーハッシュ}{拡張子}` であれば何もしない）。
+        
         Args:
             cache_key: キャッシュキー
             file_path: 音声ファイルのパス
         """
-        key_hash = cache_key.to_hash()
-        
-        # キャッシュディレクトリにファイルをコピー
         try:
-            source_path = Path(file_path)
-            if not source_path.exists():
-                logger.warning(f"Source file does not exist: {file_path}")
+            target = self._resolve_put_target(cache_key, file_path)
+            if target is None:
                 return
+            source_path, cache_file_path, size_bytes = target
             
-            # キャッシュファイル名を生成
-            file_extension = source_path.suffix
-            cache_file_path = self.cache_dir / f"{key_hash}{file_extension}"
-            
-            # ファイルをコピー
-            import shutil
-            shutil.copy2(source_path, cache_file_path)
+            # ファイルを配置（キャッシュディレクトリ内ならrename、他はハードリンクかカーネル内コピー）
+            self._place_file(source_path, cache_file_path, size_bytes)
+            self._register_entry(cache_key.to_hash(), cache_file_path, size_bytes)
             
-            # LRU削除チェック
-            self._evict_lru()
+            logger.debug(f"Cached file: {cache_key} -> {cache_file_path}")
             
-            # キャッシュエントリーを作成
-            entry = CacheEntry(str(cache_file_path))
-            self._cache[key_hash] = entry
+        except Exception as e:
+            logger.warning(f"Failed to cache file: {e}")
+    
+    async def put_async(self, cache_key: TTSCacheKey, file_path: str) -> None:
+        """
+        音声ファイルをキャッシュに保存（ノンブロッキング版）
+        
+        保存要求をバックグラウンドライターのキューに積んで即座に返る。
+        ファイル配置はスレッドプールで行い、メタデータの更新はイベントループ上で
+        直列に処理する。
+        
+        Args:
+            cache_key: キャッシュキー
+            file_path: 音声ファイルのパス
+        """
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+        
+        # ハッシュ計算はキュー投入前に済ませておく
+        cache_key.to_hash()
+        self._writer_queue.put_nowait((cache_key, file_path))
+    
+    async def _put_now(self, cache_key: TTSCacheKey, file_path: str) -> None:
+        """
+        音声ファイルをキャッシュに保存し、登録完了まで待機
+        
+        ファイル配置はスレッドプールで行い、戻った時点でエントリーは登録済みになる。
+        
+        Args:
+            cache_key: キャッシュキー
+            file_path: 音声ファイルのパス
+        """
+        try:
+            target = self._resolve_put_target(cache_key, file_path)
+            if target is None:
+                return
+            source_path, cache_file_path, size_bytes = target
             
-            # メタデータ保存
-            self._save_metadata()
+            await asyncio.to_thread(self._place_file, source_path, cache_file_path, size_bytes)
+            self._register_entry(cache_key.to_hash(), cache_file_path, size_bytes)
             
             logger.debug(f"Cached file: {cache_key} -> {cache_file_path}")
             
         except Exception as e:
             logger.warning(f"Failed to cache file: {e}")
     
+    async def drain(self) -> None:
+        """キューに積まれた保存要求がすべて完了するまで待機"""
+        if self._writer_queue is not None and self._writer_task and not self._writer_task.done():
+            await self._writer_queue.join()
+        self._flush_journal()
+    
+    async def _writer_loop(self) -> None:
+        """put_asyncの保存要求を順に処理するバックグラウンドタスク"""
+        queue = self._writer_queue
+        pending_flush = 0
+        
+        while True:
+            cache_key, file_path = await queue.get()
+            try:
+                target = self._resolve_put_target(cache_key, file_path)
+                if target is not None:
+                    source_path, cache_file_path, size_bytes = target
+                    await asyncio.to_thread(self._place_file, source_path, cache_file_path, size_bytes)
+                    self._register_entry(cache_key.to_hash(), cache_file_path, size_bytes, flush=False)
+                    pending_flush += 1
+                    logger.debug(f"Cached file: {cache_key} -> {cache_file_path}")
+            except Exception as e:
+                logger.warning(f"Failed to cache file: {e}")
+            finally:
+                # キューが空になったとき、または16件ごとにまとめてフラッシュ
+                if pending_flush and (queue.empty() or pending_flush >= 16):
+                    self._flush_journal()
+                    pending_flush = 0
+                queue.task_done()
+    
+    def _resolve_put_target(self, cache_key: TTSCacheKey, file_path: str) -> Optional[Tuple[Path, Path, int]]:
+        """
+        保存元と保存先のパスを決定
+        
+        Returns:
+            Optional[Tuple[Path, Path, int]]: (ソースパス, キャッシュファイルパス, ファイルサイズ)、
+            ソースが無い場合はNone
+        """
+        source_path = Path(file_path)
+        try:
+            size_bytes = source_path.stat().st_size
+        except OSError:
+            logger.warning(f"Source file does not exist: {file_path}")
+            return None
+        
+        # キャッシュファイル名を生成
+        file_extension = source_path.suffix
+        return source_path, self.cache_dir / f"{cache_key.to_hash()}{file_extension}", size_bytes
+    
+    def _register_entry(
+        self,
+        key_hash: str,
+        cache_file_path: Path,
+        size_bytes: int,
+        flush: bool = True
+    ) -> None:
+        """配置済みのキャッシュファイルをエントリーとして登録"""
+        # 同じキーの再登録では古いエントリーのサイズを差し引く
+        previous = self._cache.pop(key_hash, None)
+        if previous is not None:
+            self._total_size -= previous.size_bytes
+        
+        # LRU削除チェック
+        self._evict_lru()
+        
+        # キャッシュエントリーを作成
+        entry = CacheEntry(str(cache_file_path), size_bytes=size_bytes)
+        self._cache[key_hash] = entry
+        self._total_size += size_bytes
+        
+        # メタデータ保存（ジャーナルへ追記し、必要に応じて圧縮）
+        self._append_entry(key_hash, entry, flush=flush)
+        self._compact_if_needed()
+    
     def clear(self) -> None:
         """キャッシュをクリア"""
         # すべてのキャッシュファイルを削除
-        for entry in self._cache.values():
-            try:
-                Path(entry.file_path).unlink(missing_ok=True)
-            except Exception as e:
-                logger.warning(f"Failed to delete cached file {entry.file_path}: {e}")
+        _unlink_files([entry.file_path for entry in self._cache.values()])
         
         self._cache.clear()
+        self._total_size = 0
         
         # メタデータファイルも削除
+        self._close_journal()
+        self._journal_lines = 0
         self.metadata_file.unlink(missing_ok=True)
+        self.journal_file.unlink(missing_ok=True)
         
         # 統計情報リセット
         self.hits = 0
@@ -311,13 +888,8 @@ class TTSCache:
         total_requests = self.hits + self.misses
         hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
         
-        # キャッシュサイズの計算
-        total_size = 0
-        for entry in self._cache.values():
-            try:
-                total_size += Path(entry.file_path).stat().st_size
-            except Exception:
-                pass
+        # キャッシュサイズ（追加・削除時に更新済みの合計値）
+        total_size = self._total_size
         
         return {
             "entries": len(self._cache),
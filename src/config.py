@@ -8,19 +8,46 @@ Phase 3: プロダクション品質対応
 - 設定バリデーション
 """
 
+import hashlib
 import json
 import os
-from dataclasses import dataclass, asdict
+from collections import ChainMap
+from dataclasses import dataclass, fields
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional, Literal
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Literal, get_args
+
+# orjsonはオプション（未インストール時は標準のjsonを使用）
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 型定義
 VoiceType = Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer", "coral"]
 ResponseFormat = Literal["mp3", "opus", "aac", "flac", "wav", "pcm"]
 OutputMode = Literal["file", "play", "both"]
 
+# 有効値一覧（型定義と同じ順序。ツールスキーマの enum でも共有）
+VOICES = get_args(VoiceType)
+RESPONSE_FORMATS = get_args(ResponseFormat)
+OUTPUT_MODES = get_args(OutputMode)
+
+# 速度の有効範囲
+SPEED_MIN = 0.25
+SPEED_MAX = 4.0
+
+# バリデーション用の集合とエラーメッセージ用の結合文字列（呼び出しごとの再構築を避ける）
+_VALID_VOICES = frozenset(VOICES)
+_VALID_FORMATS = frozenset(RESPONSE_FORMATS)
+_VALID_MODES = frozenset(OUTPUT_MODES)
+_VALID_VOICES_JOINED = ", ".join(VOICES)
+_VALID_FORMATS_JOINED = ", ".join(RESPONSE_FORMATS)
+_VALID_MODES_JOINED = ", ".join(OUTPUT_MODES)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TTSPreset:
     """音声プリセット設定"""
     name: str
@@ -31,7 +58,7 @@ class TTSPreset:
     instructions: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TTSDefaults:
     """TTS デフォルト設定"""
     voice: VoiceType = "alloy"
@@ -41,7 +68,7 @@ class TTSDefaults:
     instructions: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CacheConfig:
     """キャッシュ設定"""
     enabled: bool = True
@@ -49,7 +76,7 @@ class CacheConfig:
     ttl_hours: int = 24
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     """サーバー設定"""
     name: str = "openai-tts"
@@ -57,6 +84,20 @@ class ServerConfig:
     temp_dir_cleanup_hours: int = 24
     max_text_length: int = 4096
     long_text_split_size: int = 4000
+    max_concurrent_requests: int = 3
+    warmup_enabled: bool = True
+
+
+# 設定データクラスのフィールド名（保存時に asdict の再帰コピーを避けるため事前に取得）
+_FIELD_NAMES = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (TTSPreset, TTSDefaults, CacheConfig, ServerConfig)
+}
+
+
+def _to_dict(obj) -> Dict[str, Any]:
+    """フラットな設定データクラスを辞書に変換"""
+    return {name: getattr(obj, name) for name in _FIELD_NAMES[type(obj)]}
 
 
 class ConfigManager:
@@ -114,6 +155,12 @@ class ConfigManager:
         )
     }
     
+    # エラーメッセージ用に組み込みプリセット名を事前に結合
+    _BUILTIN_NAMES_JOINED = ", ".join(BUILTIN_PRESETS)
+    
+    # 検証済みパラメータの保持上限
+    _VALIDATED_PARAMS_MAX = 256
+    
     def __init__(self, config_file: Optional[Path] = None):
         """
         設定管理を初期化
@@ -130,6 +177,15 @@ class ConfigManager:
         self.server_config = ServerConfig()
         self.custom_presets: Dict[str, TTSPreset] = {}
         
+        # 名前解決済みのプリセット索引（カスタムプリセット変更時に再構築）
+        self._preset_index: Dict[str, TTSPreset] = dict(self.BUILTIN_PRESETS)
+        
+        # 設定ファイル内容のダイジェスト（内容が変わらない保存を省略するため）
+        self._config_digest = b""
+        
+        # 検証済みパラメータ（テキスト以外）の組み合わせ -> 正規化結果
+        self._validated_params: Dict[tuple, Dict[str, Any]] = {}
+        
         # 設定ファイルの読み込み
         self.load_config()
         
@@ -149,8 +205,9 @@ class ConfigManager:
             return
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            data = self.config_file.read_bytes()
+            self._config_digest = self._digest(data)
+            config_data = orjson.loads(data) if orjson is not None else json.loads(data)
             
             # デフォルト設定の読み込み
             if "defaults" in config_data:
@@ -174,6 +231,7 @@ class ConfigManager:
                     name: TTSPreset(**preset_data)
                     for name, preset_data in presets_data.items()
                 }
+                self._rebuild_preset_index()
         
         except Exception as e:
             # 設定ファイルが破損している場合はデフォルト設定を使用
@@ -183,21 +241,43 @@ class ConfigManager:
     def save_config(self) -> None:
         """設定ファイルに保存"""
         config_data = {
-            "defaults": asdict(self.defaults),
-            "cache": asdict(self.cache_config),
-            "server": asdict(self.server_config),
+            "defaults": _to_dict(self.defaults),
+            "cache": _to_dict(self.cache_config),
+            "server": _to_dict(self.server_config),
             "custom_presets": {
-                name: asdict(preset)
+                name: _to_dict(preset)
                 for name, preset in self.custom_presets.items()
             }
         }
         
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(config_data, ensure_ascii=False, indent=2).encode('utf-8')
+            
+            # 内容に変化がなければ書き込みを省略
+            digest = self._digest(payload)
+            if digest == self._config_digest:
+                return
+            
+            # 一時ファイルに書き込んでから置き換え（書き込み途中の破損を防ぐ）
+            temp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                # 置き換え前に内容をディスクへ反映（電源断後に空ファイルが残らないように）
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.config_file)
+            self._config_digest = digest
         except Exception as e:
             print(f"Warning: Failed to save config file: {e}")
     
+    @staticmethod
+    def _digest(payload: bytes) -> bytes:
+        """設定ファイル内容のダイジェストを計算"""
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
     def get_preset(self, preset_name: str) -> Optional[TTSPreset]:
         """
         プリセットを取得
@@ -208,23 +288,21 @@ class ConfigManager:
         Returns:
             TTSPreset: プリセット設定、見つからない場合はNone
         """
-        # 組み込みプリセットを優先
-        if preset_name in self.BUILTIN_PRESETS:
-            return self.BUILTIN_PRESETS[preset_name]
-        
-        # カスタムプリセット
-        return self.custom_presets.get(preset_name)
+        return self._preset_index.get(preset_name)
     
-    def list_presets(self) -> Dict[str, TTSPreset]:
+    def _rebuild_preset_index(self) -> None:
+        """プリセット索引を再構築（組み込みプリセットを優先）"""
+        self._preset_index = {**self.custom_presets, **self.BUILTIN_PRESETS}
+    
+    def list_presets(self) -> Mapping[str, TTSPreset]:
         """
         利用可能なプリセット一覧を取得
         
         Returns:
-            Dict[str, TTSPreset]: プリセット名と設定のマッピング
+            Mapping[str, TTSPreset]: プリセット名と設定の読み取り専用マッピング
+            （辞書のコピーは作らず、カスタム→組み込みの順に参照する）
         """
-        all_presets = self.BUILTIN_PRESETS.copy()
-        all_presets.update(self.custom_presets)
-        return all_presets
+        return MappingProxyType(ChainMap(self.custom_presets, self.BUILTIN_PRESETS))
     
     def add_custom_preset(self, preset: TTSPreset) -> None:
         """
@@ -238,6 +316,7 @@ class ConfigManager:
             raise ValueError(f"Cannot override builtin preset: {preset.name}")
         
         self.custom_presets[preset.name] = preset
+        self._rebuild_preset_index()
         self.save_config()
     
     def remove_custom_preset(self, preset_name: str) -> bool:
@@ -252,6 +331,7 @@ class ConfigManager:
         """
         if preset_name in self.custom_presets:
             del self.custom_presets[preset_name]
+            self._rebuild_preset_index()
             self.save_config()
             return True
         return False
@@ -287,25 +367,49 @@ class ConfigManager:
         # プリセットが指定された場合はプリセットから設定を取得
         if preset:
             preset_config = self.get_preset(preset)
-            if not preset_config:
-                available_presets = list(self.list_presets().keys())
+            if preset_config is None:
+                available_presets = self._BUILTIN_NAMES_JOINED
+                if self.custom_presets:
+                    available_presets += ", " + ", ".join(self.custom_presets)
                 raise ValueError(
                     f"不明なプリセット: {preset}. "
-                    f"利用可能なプリセット: {', '.join(available_presets)}"
+                    f"利用可能なプリセット: {available_presets}"
                 )
             
             # プリセットの値を使用（個別指定があれば上書き）
-            voice = voice or preset_config.voice
-            speed = speed or preset_config.speed
-            response_format = response_format or preset_config.response_format
-            instructions = instructions or preset_config.instructions
+            if voice is None:
+                voice = preset_config.voice
+            if speed is None:
+                speed = preset_config.speed
+            if response_format is None:
+                response_format = preset_config.response_format
+            if instructions is None:
+                instructions = preset_config.instructions
+        
+        # デフォルト値の適用（0.0 など偽と評価される指定値は上書きしない）
+        defaults = self.defaults
+        if voice is None:
+            voice = defaults.voice
+        if speed is None:
+            speed = defaults.speed
+        if response_format is None:
+            response_format = defaults.response_format
+        if output_mode is None:
+            output_mode = defaults.output_mode
+        if instructions is None:
+            instructions = defaults.instructions
         
-        # デフォルト値の適用
-        voice = voice or self.defaults.voice
-        speed = speed or self.defaults.speed
-        response_format = response_format or self.defaults.response_format
-        output_mode = output_mode or self.defaults.output_mode
-        instructions = instructions or self.defaults.instructions
+        # 同一の組み合わせは検証済みの結果を再利用（テキストのみ毎回検証）
+        # True == 1 のように型が違っても等価な値を区別するため、型もキーに含める
+        key = (
+            voice, speed, type(speed), response_format, output_mode,
+            instructions, type(instructions), preset
+        )
+        try:
+            cached = self._validated_params.get(key)
+        except TypeError:
+            # ハッシュ不可能な値が渡された場合はキャッシュを使わない
+            key = cached = None
         
         # バリデーション
         if not text or not text.strip():
@@ -317,43 +421,59 @@ class ConfigManager:
                 f"{len(text)}文字入力されました。"
             )
         
+        if cached is not None:
+            return {"text": text.strip(), **cached}
+        
         # 音声の検証
-        valid_voices = ["alloy", "echo", "fable", "onyx", "nova", "shimmer", "coral"]
-        if voice not in valid_voices:
-            raise ValueError(f"サポートされていない音声です。使用可能な音声: {', '.join(valid_voices)}")
+        if not isinstance(voice, str) or voice not in _VALID_VOICES:
+            raise ValueError(f"サポートされていない音声です。使用可能な音声: {_VALID_VOICES_JOINED}")
         
-        # 速度の検証
-        if not isinstance(speed, (int, float)):
+        # 速度の検証（bool と数字の文字列は float() が受け付けてしまうため先に除外する）
+        if isinstance(speed, (bool, str, bytes)):
             raise ValueError("速度は数値で指定してください。")
+        try:
+            speed_value = float(speed)
+        except (TypeError, ValueError):
+            raise ValueError("速度は数値で指定してください。") from None
         
-        if not (0.25 <= speed <= 4.0):
-            raise ValueError(f"速度は0.25～4.0の範囲で指定してください。入力値: {speed}")
+        if not SPEED_MIN <= speed_value <= SPEED_MAX:
+            raise ValueError(f"速度は{SPEED_MIN}～{SPEED_MAX}の範囲で指定してください。入力値: {speed}")
         
         # 出力形式の検証
-        valid_formats = ["mp3", "opus", "aac", "flac", "wav", "pcm"]
-        if response_format not in valid_formats:
-            raise ValueError(f"サポートされていない出力形式です。使用可能な形式: {', '.join(valid_formats)}")
+        if not isinstance(response_format, str) or response_format not in _VALID_FORMATS:
+            raise ValueError(f"サポートされていない出力形式です。使用可能な形式: {_VALID_FORMATS_JOINED}")
         
         # 出力モードの検証
-        valid_modes = ["file", "play", "both"]
-        if output_mode not in valid_modes:
-            raise ValueError(f"サポートされていない出力モードです。使用可能なモード: {', '.join(valid_modes)}")
+        if not isinstance(output_mode, str) or output_mode not in _VALID_MODES:
+            raise ValueError(f"サポートされていない出力モードです。使用可能なモード: {_VALID_MODES_JOINED}")
         
-        return {
-            "text": text.strip(),
+        validated = {
             "voice": voice,
-            "speed": float(speed),
+            "speed": speed_value,
             "response_format": response_format,
             "output_mode": output_mode,
             "instructions": instructions,
             "preset": preset
         }
+        
+        if key is not None:
+            if len(self._validated_params) >= self._VALIDATED_PARAMS_MAX:
+                # 最も古い組み合わせを破棄
+                del self._validated_params[next(iter(self._validated_params))]
+            self._validated_params[key] = validated
+        
+        return {"text": text.strip(), **validated}
     
-    def get_temp_dir(self) -> Path:
-        """一時ディレクトリパスを取得"""
+    @cached_property
+    def temp_dir(self) -> Path:
+        """一時ディレクトリパス（初回アクセス時に作成）"""
         temp_dir = Path.home() / ".cache" / "openai-tts-mcp"
         temp_dir.mkdir(parents=True, exist_ok=True)
         return temp_dir
+    
+    def get_temp_dir(self) -> Path:
+        """一時ディレクトリパスを取得"""
+        return self.temp_dir
 
 
 # グローバル設定インスタンス（シングルトン）
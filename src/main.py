@@ -12,12 +12,33 @@ Phase 3: プロダクション品質対応版
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
 import sys
+import time
 from pathlib import Path
 from typing import List
 
+# orjsonはオプション（未インストール時は標準のjsonを使用）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# uvloopはオプション（未インストール時は標準のイベントループを使用）
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# fastjsonschemaはオプション（未インストール時は同じスキーマを簡易検証器で検証）
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 # セキュアなログ設定
 logging.basicConfig(
     level=logging.INFO,
@@ -26,227 +47,360 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# .envファイルのロード
+# 依存モジュールのインポート
+# （OpenAI SDK を読み込む tts_client / audio_player は初回使用時にインポート）
 try:
     from dotenv import load_dotenv
-    
-    project_root = Path(__file__).parent.parent
-    env_path = project_root / ".env"
-    load_dotenv(env_path)
-    logger.info("Environment configuration loaded successfully")
-    
-except ImportError as e:
-    logger.error(f"Failed to import dotenv: {e}")
-    sys.exit(1)
-
-# MCPライブラリのインポート
-try:
     from mcp.server import Server
     from mcp.server.stdio import stdio_server
     import mcp.types as types
-    logger.info("MCP modules imported successfully")
-    
-except ImportError as e:
-    logger.error(f"Failed to import MCP modules: {e}")
-    sys.exit(1)
-
-# 自作モジュール
-try:
-    from tts_client import TTSClient
-    from audio_player import AudioPlayer
-    from config import get_config, TTSPreset
+    from config import (
+        get_config, ConfigManager, TTSPreset,
+        VOICES, RESPONSE_FORMATS, OUTPUT_MODES, SPEED_MIN, SPEED_MAX
+    )
     from cache import get_cache
-    from utils import estimate_speech_duration
-    logger.info("All custom modules imported successfully")
 except ImportError as e:
-    logger.error(f"Failed to import custom modules: {e}")
+    logger.error(f"Failed to import required modules: {e}")
     sys.exit(1)
 
+# .envファイルのロード（APIキーが既に環境変数にある場合やファイルがない場合は省略）
+env_path = Path(__file__).parent.parent / ".env"
+if not os.getenv("OPENAI_API_KEY") and env_path.is_file():
+    load_dotenv(env_path, override=False)
+    logger.info("Environment configuration loaded from .env")
+
 # MCPサーバーの初期化
 app = Server(name="openai-tts", version="0.3.0")
 
 
-@app.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """
-    利用可能なツール一覧を返す
-    Phase 3: 高度な機能対応版（6ツール提供）
-    """
-    logger.info("Listing available tools")
-    return [
-        types.Tool(
-            name="generate_speech",
-            description=(
-                "テキストを音声ファイルに変換します。OpenAI TTSを使用して高品質な音声を生成し、"
-                "指定された形式でファイル保存や音声再生を行います。"
-                "長文（4096文字超）の自動分割、キャッシュによる高速化、プリセット機能をサポート。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "音声に変換するテキスト（最大4096文字、超過時は自動分割）",
-                        "maxLength": 50000  # 長文対応
-                    },
-                    "voice": {
-                        "type": "string",
-                        "description": "使用する音声の種類",
-                        "enum": ["alloy", "echo", "fable", "onyx", "nova", "shimmer", "coral"],
-                        "default": "alloy"
-                    },
-                    "speed": {
-                        "type": "number",
-                        "description": "音声の再生速度（0.25-4.0）",
-                        "minimum": 0.25,
-                        "maximum": 4.0,
-                        "default": 1.0
-                    },
-                    "response_format": {
-                        "type": "string",
-                        "description": "出力音声の形式",
-                        "enum": ["mp3", "opus", "aac", "flac", "wav", "pcm"],
-                        "default": "mp3"
-                    },
-                    "output_mode": {
-                        "type": "string",
-                        "description": "出力方法（file: ファイル保存のみ, play: 音声再生のみ, both: 両方）",
-                        "enum": ["file", "play", "both"],
-                        "default": "file"
-                    },
-                    "instructions": {
-                        "type": "string",
-                        "description": "音声の特徴指示（例: 'ゆっくりと優しく話してください'）"
-                    },
-                    "preset": {
-                        "type": "string",
-                        "description": "音声プリセット名（指定すると他のパラメータより優先）",
-                        "enum": ["cheerful_female", "calm_male", "professional", "gentle_female", "energetic", "storyteller"]
-                    },
-                    "enable_cache": {
-                        "type": "boolean",
-                        "description": "キャッシュ使用の有効/無効",
-                        "default": True
-                    },
-                    "merge_long_audio": {
-                        "type": "boolean",
-                        "description": "長文分割時に音声ファイルを結合するか",
-                        "default": False
-                    }
+def _dumps(obj) -> str:
+    """ツール応答用のコンパクトなJSON文字列を生成（非ASCII文字はそのまま）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def _error_response(error: Exception, message: str, **extra) -> list[types.TextContent]:
+    """ツール共通のエラーレスポンスを生成"""
+    error_result = {
+        "success": False,
+        "error": str(error),
+        "message": message,
+        **extra
+    }
+    return [types.TextContent(type="text", text=_dumps(error_result))]
+
+
+def _speech_parameters(text, voice, speed, response_format, output_mode, preset) -> dict:
+    """generate_speech の応答に含めるパラメータ情報を生成"""
+    return {
+        "text_length": len(text) if text else 0,
+        "voice": voice,
+        "speed": speed,
+        "response_format": response_format,
+        "output_mode": output_mode,
+        "preset": preset
+    }
+
+
+# ツール定義（実行中に変化しないため、インポート時に一度だけ構築）
+_TOOLS: tuple[types.Tool, ...] = (
+    types.Tool(
+        name="generate_speech",
+        description=(
+            "テキストを音声ファイルに変換します。OpenAI TTSを使用して高品質な音声を生成し、"
+            "指定された形式でファイル保存や音声再生を行います。"
+            "長文（4096文字超）の自動分割、キャッシュによる高速化、プリセット機能をサポート。"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "音声に変換するテキスト（最大4096文字、超過時は自動分割）",
+                    "maxLength": 50000  # 長文対応
                 },
-                "required": ["text"],
-                "additionalProperties": False
-            }
+                "voice": {
+                    "type": "string",
+                    "description": "使用する音声の種類",
+                    "enum": list(VOICES),
+                    "default": "alloy"
+                },
+                "speed": {
+                    "type": "number",
+                    "description": "音声の再生速度（0.25-4.0）",
+                    "minimum": SPEED_MIN,
+                    "maximum": SPEED_MAX,
+                    "default": 1.0
+                },
+                "response_format": {
+                    "type": "string",
+                    "description": "出力音声の形式",
+                    "enum": list(RESPONSE_FORMATS),
+                    "default": "mp3"
+                },
+                "output_mode": {
+                    "type": "string",
+                    "description": "出力方法（file: ファイル保存のみ, play: 音声再生のみ, both: 両方）",
+                    "enum": list(OUTPUT_MODES),
+                    "default": "file"
+                },
+                "instructions": {
+                    "type": "string",
+                    "description": "音声の特徴指示（例: 'ゆっくりと優しく話してください'）"
+                },
+                "preset": {
+                    "type": "string",
+                    # manage_presets で追加したカスタムプリセットも指定できるため enum にはしない
+                    # （未知のプリセット名は validate_tts_parameters がエラーにする）
+                    "description": (
+                        "音声プリセット名（指定すると他のパラメータより優先）。"
+                        f"組み込み: {', '.join(ConfigManager.BUILTIN_PRESETS)}"
+                    )
+                },
+                "enable_cache": {
+                    "type": "boolean",
+                    "description": "キャッシュ使用の有効/無効",
+                    "default": True
+                },
+                "merge_long_audio": {
+                    "type": "boolean",
+                    "description": "長文分割時に音声ファイルを結合するか",
+                    "default": False
+                },
+                "include_estimation": {
+                    "type": "boolean",
+                    "description": "応答に再生時間・生成時間の推定情報を含めるか",
+                    "default": False
+                },
+                "include_cache_stats": {
+                    "type": "boolean",
+                    "description": "応答にキャッシュ統計を含めるか",
+                    "default": False
+                }
+            },
+            "required": ["text"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="list_voices",
+        description=(
+            "OpenAI TTSで利用可能な音声の一覧と特徴を取得します。"
+            "各音声の特徴や適用場面、プリセット情報を確認できます。"
         ),
-        types.Tool(
-            name="list_voices",
-            description=(
-                "OpenAI TTSで利用可能な音声の一覧と特徴を取得します。"
-                "各音声の特徴や適用場面、プリセット情報を確認できます。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False
-            }
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_voice_preview",
+        description=(
+            "指定した音声のプレビューサンプルを生成します。"
+            "音声選択の参考にするためのサンプル音声を提供します。"
         ),
-        types.Tool(
-            name="get_voice_preview",
-            description=(
-                "指定した音声のプレビューサンプルを生成します。"
-                "音声選択の参考にするためのサンプル音声を提供します。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "voice": {
-                        "type": "string",
-                        "description": "プレビューする音声",
-                        "enum": ["alloy", "echo", "fable", "onyx", "nova", "shimmer", "coral"]
-                    },
-                    "sample_text": {
-                        "type": "string",
-                        "description": "プレビュー用テキスト（省略時はデフォルト使用）",
-                        "default": "これはサンプル音声です。Hello, this is a sample voice."
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "voice": {
+                    "type": "string",
+                    "description": "プレビューする音声",
+                    "enum": list(VOICES)
                 },
-                "required": ["voice"],
-                "additionalProperties": False
-            }
+                "sample_text": {
+                    "type": "string",
+                    "description": "プレビュー用テキスト（省略時はデフォルト使用）",
+                    "default": "これはサンプル音声です。Hello, this is a sample voice."
+                }
+            },
+            "required": ["voice"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_cache_stats",
+        description=(
+            "キャッシュシステムの統計情報を取得します。"
+            "ヒット率、使用量、エントリー数などのパフォーマンス情報を表示します。"
         ),
-        types.Tool(
-            name="get_cache_stats",
-            description=(
-                "キャッシュシステムの統計情報を取得します。"
-                "ヒット率、使用量、エントリー数などのパフォーマンス情報を表示します。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False
-            }
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="manage_presets",
+        description=(
+            "音声プリセットの管理を行います。"
+            "プリセット一覧の取得、カスタムプリセットの追加・削除が可能です。"
         ),
-        types.Tool(
-            name="manage_presets",
-            description=(
-                "音声プリセットの管理を行います。"
-                "プリセット一覧の取得、カスタムプリセットの追加・削除が可能です。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "description": "実行するアクション",
-                        "enum": ["list", "add", "remove"],
-                        "default": "list"
-                    },
-                    "preset_name": {
-                        "type": "string",
-                        "description": "プリセット名（add/remove時に必要）"
-                    },
-                    "preset_config": {
-                        "type": "object",
-                        "description": "プリセット設定（add時に必要）",
-                        "properties": {
-                            "description": {"type": "string"},
-                            "voice": {"type": "string", "enum": ["alloy", "echo", "fable", "onyx", "nova", "shimmer", "coral"]},
-                            "speed": {"type": "number", "minimum": 0.25, "maximum": 4.0},
-                            "response_format": {"type": "string", "enum": ["mp3", "opus", "aac", "flac", "wav", "pcm"]},
-                            "instructions": {"type": "string"}
-                        }
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "description": "実行するアクション",
+                    "enum": ["list", "add", "remove"],
+                    "default": "list"
                 },
-                "required": ["action"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="estimate_speech_info",
-            description=(
-                "テキストから音声の推定情報を計算します。"
-                "生成時間、再生時間、文字数などの詳細情報を提供します。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "推定対象のテキスト"
-                    },
-                    "speed": {
-                        "type": "number",
-                        "description": "再生速度（0.25-4.0）",
-                        "minimum": 0.25,
-                        "maximum": 4.0,
-                        "default": 1.0
+                "preset_name": {
+                    "type": "string",
+                    "description": "プリセット名（add/remove時に必要）"
+                },
+                "preset_config": {
+                    "type": "object",
+                    "description": "プリセット設定（add時に必要）",
+                    "properties": {
+                        "description": {"type": "string"},
+                        "voice": {"type": "string", "enum": list(VOICES)},
+                        "speed": {"type": "number", "minimum": SPEED_MIN, "maximum": SPEED_MAX},
+                        "response_format": {"type": "string", "enum": list(RESPONSE_FORMATS)},
+                        "instructions": {"type": "string"}
                     }
+                }
+            },
+            "required": ["action"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="estimate_speech_info",
+        description=(
+            "テキストから音声の推定情報を計算します。"
+            "生成時間、再生時間、文字数などの詳細情報を提供します。"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "推定対象のテキスト"
                 },
-                "required": ["text"],
-                "additionalProperties": False
-            }
-        )
-    ]
+                "speed": {
+                    "type": "number",
+                    "description": "再生速度（0.25-4.0）",
+                    "minimum": SPEED_MIN,
+                    "maximum": SPEED_MAX,
+                    "default": 1.0
+                }
+            },
+            "required": ["text"],
+            "additionalProperties": False
+        }
+    )
+)
+
+# JSONスキーマの型ごとの判定（boolはintのサブクラスのため数値から除外）
+_SCHEMA_TYPE_CHECKS = {
+    "object": lambda value: isinstance(value, dict),
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+}
+
+
+def _check_schema(value, schema: dict, path: str = "data") -> None:
+    """
+    ツール引数をスキーマで検証（fastjsonschema未導入時のフォールバック）
+    
+    ツール定義で使っているキーワード（type, enum, minimum, maximum, maxLength,
+    properties, required, additionalProperties）のみを扱う。
+    
+    Raises:
+        ValueError: スキーマに合わない場合
+    """
+    expected_type = schema.get("type")
+    if expected_type is not None and not _SCHEMA_TYPE_CHECKS[expected_type](value):
+        raise ValueError(f"{path} must be {expected_type}")
+    if "enum" in schema and value not in schema["enum"]:
+        raise ValueError(f"{path} must be one of {schema['enum']}")
+    if "minimum" in schema and value < schema["minimum"]:
+        raise ValueError(f"{path} must be bigger than or equal to {schema['minimum']}")
+    if "maximum" in schema and value > schema["maximum"]:
+        raise ValueError(f"{path} must be smaller than or equal to {schema['maximum']}")
+    if "maxLength" in schema and len(value) > schema["maxLength"]:
+        raise ValueError(f"{path} must be shorter than or equal to {schema['maxLength']} characters")
+    
+    if expected_type == "object":
+        properties = schema.get("properties", {})
+        for name in schema.get("required", ()):
+            if name not in value:
+                raise ValueError(f"{path} must contain {name} properties")
+        for name, item in value.items():
+            if name in properties:
+                _check_schema(item, properties[name], f"{path}.{name}")
+            elif schema.get("additionalProperties", True) is False:
+                raise ValueError(f"{path} must not contain {name} properties")
+
+
+# ツール引数のスキーマ検証器（インポート時に一度だけ用意、検証失敗時はValueErrorを送出）
+# use_default=False: スキーマの default で未指定の引数を埋めない（プリセットの値を優先するため）
+if fastjsonschema is not None:
+    _ARGUMENT_VALIDATORS = {
+        tool.name: fastjsonschema.compile(tool.inputSchema, use_default=False)
+        for tool in _TOOLS
+    }
+else:
+    _ARGUMENT_VALIDATORS = {
+        tool.name: functools.partial(_check_schema, schema=tool.inputSchema)
+        for tool in _TOOLS
+    }
+
+
+# TTSクライアント（シングルトン、初回使用時に生成）
+_tts_client = None
+
+
+def _get_tts_client():
+    """TTSクライアントのインスタンスを取得（シングルトン）"""
+    global _tts_client
+    if _tts_client is None:
+        from tts_client import TTSClient
+        _tts_client = TTSClient()
+    return _tts_client
+
+
+# 古い一時ファイルのクリーンアップ間隔（秒）と実行状態
+# 通常は生成記録から期限切れ分のみ削除し、ディレクトリ全体の走査は間隔を空けて行う
+CLEANUP_INTERVAL_SECONDS = 300
+ORPHAN_SWEEP_INTERVAL_SECONDS = 3600
+_last_cleanup = float("-inf")
+_last_orphan_sweep = float("-inf")
+_cleanup_task: asyncio.Task | None = None
+
+
+def _schedule_cleanup(tts_client) -> None:
+    """古い一時ファイルの削除を、前回から一定時間経過していればスレッドで実行"""
+    global _last_cleanup, _last_orphan_sweep, _cleanup_task
+    now = time.monotonic()
+    if now - _last_cleanup < CLEANUP_INTERVAL_SECONDS:
+        return
+    if _cleanup_task is not None and not _cleanup_task.done():
+        return
+    _last_cleanup = now
+    if now - _last_orphan_sweep >= ORPHAN_SWEEP_INTERVAL_SECONDS:
+        _last_orphan_sweep = now
+        cleanup = tts_client.cleanup_old_files
+    else:
+        cleanup = tts_client.expire_created_files
+    _cleanup_task = asyncio.create_task(asyncio.to_thread(cleanup))
+
+
+# list_voices の応答JSON（プリセット変更時に破棄して再構築）
+_list_voices_response: str | None = None
+
+
+@app.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """
+    利用可能なツール一覧を返す
+    Phase 3: 高度な機能対応版（6ツール提供）
+    """
+    logger.info("Listing available tools")
+    return list(_TOOLS)
 
 
 @app.call_tool()
@@ -257,20 +411,17 @@ async def handle_call_tool(name: str, arguments: dict | None) -> list[types.Text
     """
     logger.info(f"Tool called: {name} with arguments: {arguments}")
     
-    if name == "generate_speech":
-        return await handle_generate_speech(arguments)
-    elif name == "list_voices":
-        return await handle_list_voices(arguments)
-    elif name == "get_voice_preview":
-        return await handle_get_voice_preview(arguments)
-    elif name == "get_cache_stats":
-        return await handle_get_cache_stats(arguments)
-    elif name == "manage_presets":
-        return await handle_manage_presets(arguments)
-    elif name == "estimate_speech_info":
-        return await handle_estimate_speech_info(arguments)
-    else:
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    
+    try:
+        _ARGUMENT_VALIDATORS[name](arguments or {})
+    except ValueError as e:
+        # fastjsonschemaの例外もValueErrorのサブクラス（メッセージはmessage属性）
+        raise ValueError(f"引数が不正です: {getattr(e, 'message', e)}") from e
+    
+    return await handler(arguments)
 
 
 async def handle_generate_speech(arguments: dict | None) -> list[types.TextContent]:
@@ -290,19 +441,20 @@ async def handle_generate_speech(arguments: dict | None) -> list[types.TextConte
     preset = arguments.get("preset")
     enable_cache = arguments.get("enable_cache", True)
     merge_long_audio = arguments.get("merge_long_audio", False)
+    include_estimation = arguments.get("include_estimation", False)
+    include_cache_stats = arguments.get("include_cache_stats", False)
     
     if not text:
         raise ValueError("textパラメータが指定されていません")
     
     try:
         logger.info(f"Generating speech - text: {len(text)} chars, preset: {preset}")
-        tts_client = TTSClient()
+        tts_client = _get_tts_client()
 
         play_requested = output_mode in ["play", "both"]
+        save_requested = output_mode in ["file", "both"]
 
-        stream_resp = None
-        played = False
-        if play_requested:
+        async def play_stream() -> bool:
             stream_resp = await tts_client.generate_speech_stream(
                 text=text,
                 voice=voice,
@@ -311,16 +463,13 @@ async def handle_generate_speech(arguments: dict | None) -> list[types.TextConte
                 instructions=instructions,
                 preset=preset,
             )
-            audio_player = AudioPlayer()
-            if hasattr(stream_resp, "__aenter__"):
-                async with stream_resp as resp:
-                    played = await audio_player.play(resp)
-            else:
-                played = await audio_player.play(stream_resp)
+            from audio_player import get_audio_player
+            audio_player = get_audio_player()
+            async with stream_resp as resp:
+                return await audio_player.play(resp)
 
-        result = []
-        if output_mode in ["file", "both"]:
-            result = await tts_client.generate_speech(
+        async def save_file():
+            return await tts_client.generate_speech(
                 text=text,
                 voice=voice,
                 speed=speed,
@@ -330,13 +479,38 @@ async def handle_generate_speech(arguments: dict | None) -> list[types.TextConte
                 preset=preset,
                 enable_cache=enable_cache,
             )
+
+        played = False
+        result = []
+        if play_requested and save_requested:
+            # "both" はストリーミング再生とファイル生成を並行実行
+            # （一方が失敗した時点で他方を取り消し、エラー応答後に再生や生成が残らないようにする）
+            play_task = asyncio.create_task(play_stream())
+            save_task = asyncio.create_task(save_file())
+            try:
+                done, _ = await asyncio.wait((play_task, save_task), return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        raise error
+                played, result = play_task.result(), save_task.result()
+            finally:
+                for task in (play_task, save_task):
+                    task.cancel()
+                await asyncio.gather(play_task, save_task, return_exceptions=True)
+        elif play_requested:
+            played = await play_stream()
+        elif save_requested:
+            result = await save_file()
         
         if result:
             if isinstance(result, list):
                 file_paths = result
                 if merge_long_audio and len(file_paths) > 1:
                     try:
-                        merged_path = tts_client.merge_long_speech_files(
+                        # 結合（再エンコード）は重いのでイベントループ外で実行
+                        merged_path = await asyncio.to_thread(
+                            tts_client.merge_long_speech_files,
                             file_paths,
                             response_format or "mp3",
                         )
@@ -357,14 +531,12 @@ async def handle_generate_speech(arguments: dict | None) -> list[types.TextConte
 
         # ``played`` indicates whether playback succeeded when requested
         
-        # 古いファイルのクリーンアップ
-        tts_client.cleanup_old_files()
-        
-        # 推定情報の取得
-        estimation = tts_client.estimate_generation_time(text, speed or 1.0)
+        # 古いファイルのクリーンアップ（一定間隔でバックグラウンド実行）
+        _schedule_cleanup(tts_client)
         
-        # キャッシュ統計の取得
-        cache_stats = tts_client.get_cache_stats()
+        # 推定情報とキャッシュ統計は要求された場合のみ計算
+        estimation = tts_client.estimate_generation_time(text, speed or 1.0) if include_estimation else None
+        cache_stats = tts_client.get_cache_stats() if include_cache_stats else None
         
         # 成功レスポンス
         result_data = {
@@ -375,13 +547,8 @@ async def handle_generate_speech(arguments: dict | None) -> list[types.TextConte
             "merged": merge_long_audio and is_long_text,
             "message": f"音声ファイルを生成しました: {len(file_paths)} ファイル",
             "parameters": {
-                "text_length": len(text),
-                "voice": voice,
-                "speed": speed,
-                "response_format": response_format,
-                "output_mode": output_mode,
+                **_speech_parameters(text, voice, speed, response_format, output_mode, preset),
                 "instructions": instructions,
-                "preset": preset,
                 "enable_cache": enable_cache
             },
             "playback_status": {
@@ -397,43 +564,34 @@ async def handle_generate_speech(arguments: dict | None) -> list[types.TextConte
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps(result_data, ensure_ascii=False, indent=2)
+                text=_dumps(result_data)
             )
         ]
         
     except Exception as e:
-        # エラーレスポンス
-        error_result = {
-            "success": False,
-            "error": str(e),
-            "message": "音声生成中にエラーが発生しました",
-            "parameters": {
-                "text_length": len(text) if text else 0,
-                "voice": voice,
-                "speed": speed,
-                "response_format": response_format,
-                "output_mode": output_mode,
-                "preset": preset
-            }
-        }
-        
         logger.error(f"Error generating speech: {e}", exc_info=True)
-        
-        return [
-            types.TextContent(
-                type="text", 
-                text=json.dumps(error_result, ensure_ascii=False, indent=2)
+        return _error_response(
+            e,
+            "音声生成中にエラーが発生しました",
+            parameters=_speech_parameters(
+                text, voice, speed, response_format, output_mode, preset
             )
-        ]
+        )
 
 
 async def handle_list_voices(arguments: dict | None) -> list[types.TextContent]:
     """
     list_voicesツールの処理（Phase 3: プリセット対応版）
     """
+    global _list_voices_response
+    
+    if _list_voices_response is not None:
+        logger.info("Listing available voices and presets (cached)")
+        return [types.TextContent(type="text", text=_list_voices_response)]
+    
     try:
         logger.info("Listing available voices and presets")
-        tts_client = TTSClient()
+        tts_client = _get_tts_client()
         
         # 音声一覧と説明を取得
         voices = tts_client.get_supported_voices()
@@ -446,8 +604,8 @@ async def handle_list_voices(arguments: dict | None) -> list[types.TextContent]:
             "presets": presets,
             "supported_formats": formats,
             "speed_range": {
-                "minimum": 0.25,
-                "maximum": 4.0,
+                "minimum": SPEED_MIN,
+                "maximum": SPEED_MAX,
                 "default": 1.0
             },
             "output_modes": [
@@ -490,31 +648,19 @@ async def handle_list_voices(arguments: dict | None) -> list[types.TextContent]:
             ]
         }
         
+        _list_voices_response = _dumps(result)
         logger.info("Voice and preset list generated successfully")
         
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
+                text=_list_voices_response
             )
         ]
         
     except Exception as e:
-        # エラーレスポンス
-        error_result = {
-            "success": False,
-            "error": str(e),
-            "message": "音声一覧の取得中にエラーが発生しました"
-        }
-        
         logger.error(f"Error listing voices: {e}", exc_info=True)
-        
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(error_result, ensure_ascii=False, indent=2)
-            )
-        ]
+        return _error_response(e, "音声一覧の取得中にエラーが発生しました")
 
 
 async def handle_get_voice_preview(arguments: dict | None) -> list[types.TextContent]:
@@ -532,13 +678,14 @@ async def handle_get_voice_preview(arguments: dict | None) -> list[types.TextCon
     
     try:
         logger.info(f"Generating voice preview for: {voice}")
-        tts_client = TTSClient()
+        tts_client = _get_tts_client()
         
         # プレビュー音声生成
         file_path = await tts_client.get_voice_preview(voice, sample_text)
         
         # 音声再生
-        audio_player = AudioPlayer()
+        from audio_player import get_audio_player
+        audio_player = get_audio_player()
         played = await audio_player.play(file_path)
         
         result = {
@@ -555,26 +702,13 @@ async def handle_get_voice_preview(arguments: dict | None) -> list[types.TextCon
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
+                text=_dumps(result)
             )
         ]
         
     except Exception as e:
-        error_result = {
-            "success": False,
-            "error": str(e),
-            "message": "音声プレビューの生成中にエラーが発生しました",
-            "voice": voice
-        }
-        
         logger.error(f"Error generating voice preview: {e}", exc_info=True)
-        
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(error_result, ensure_ascii=False, indent=2)
-            )
-        ]
+        return _error_response(e, "音声プレビューの生成中にエラーが発生しました", voice=voice)
 
 
 async def handle_get_cache_stats(arguments: dict | None) -> list[types.TextContent]:
@@ -607,31 +741,21 @@ async def handle_get_cache_stats(arguments: dict | None) -> list[types.TextConte
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
+                text=_dumps(result)
             )
         ]
         
     except Exception as e:
-        error_result = {
-            "success": False,
-            "error": str(e),
-            "message": "キャッシュ統計の取得中にエラーが発生しました"
-        }
-        
         logger.error(f"Error getting cache stats: {e}", exc_info=True)
-        
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(error_result, ensure_ascii=False, indent=2)
-            )
-        ]
+        return _error_response(e, "キャッシュ統計の取得中にエラーが発生しました")
 
 
 async def handle_manage_presets(arguments: dict | None) -> list[types.TextContent]:
     """
     manage_presetsツールの処理
     """
+    global _list_voices_response
+    
     if not arguments:
         raise ValueError("引数が指定されていません")
     
@@ -676,6 +800,7 @@ async def handle_manage_presets(arguments: dict | None) -> list[types.TextConten
             )
             
             config.add_custom_preset(preset)
+            _list_voices_response = None
             
             result = {
                 "success": True,
@@ -689,6 +814,8 @@ async def handle_manage_presets(arguments: dict | None) -> list[types.TextConten
                 raise ValueError("remove操作にはpreset_nameが必要です")
             
             removed = config.remove_custom_preset(preset_name)
+            if removed:
+                _list_voices_response = None
             
             result = {
                 "success": True,
@@ -706,26 +833,13 @@ async def handle_manage_presets(arguments: dict | None) -> list[types.TextConten
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
+                text=_dumps(result)
             )
         ]
         
     except Exception as e:
-        error_result = {
-            "success": False,
-            "error": str(e),
-            "message": "プリセット管理中にエラーが発生しました",
-            "action": action
-        }
-        
         logger.error(f"Error managing presets: {e}", exc_info=True)
-        
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(error_result, ensure_ascii=False, indent=2)
-            )
-        ]
+        return _error_response(e, "プリセット管理中にエラーが発生しました", action=action)
 
 
 async def handle_estimate_speech_info(arguments: dict | None) -> list[types.TextContent]:
@@ -743,19 +857,18 @@ async def handle_estimate_speech_info(arguments: dict | None) -> list[types.Text
     
     try:
         logger.info(f"Estimating speech info for text: {len(text)} chars")
-        tts_client = TTSClient()
+        tts_client = _get_tts_client()
         
         # 推定情報の計算
         estimation = tts_client.estimate_generation_time(text, speed)
         
-        # 長文分割情報
-        from utils import split_long_text
+        # 長文分割情報（実際の生成時と同じ分割で一度だけ分割）
         if estimation["is_long_text"]:
-            chunks = split_long_text(text)
+            chunk_lengths = [len(chunk) for chunk in tts_client.split_text(text)]
             chunk_info = {
-                "total_chunks": len(chunks),
-                "chunk_lengths": [len(chunk) for chunk in chunks],
-                "average_chunk_length": sum(len(chunk) for chunk in chunks) / len(chunks)
+                "total_chunks": len(chunk_lengths),
+                "chunk_lengths": chunk_lengths,
+                "average_chunk_length": sum(chunk_lengths) / len(chunk_lengths)
             }
         else:
             chunk_info = {
@@ -790,25 +903,24 @@ async def handle_estimate_speech_info(arguments: dict | None) -> list[types.Text
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps(result, ensure_ascii=False, indent=2)
+                text=_dumps(result)
             )
         ]
         
     except Exception as e:
-        error_result = {
-            "success": False,
-            "error": str(e),
-            "message": "音声情報の推定中にエラーが発生しました"
-        }
-        
         logger.error(f"Error estimating speech info: {e}", exc_info=True)
-        
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(error_result, ensure_ascii=False, indent=2)
-            )
-        ]
+        return _error_response(e, "音声情報の推定中にエラーが発生しました")
+
+
+# ツール名 -> 処理関数
+_TOOL_HANDLERS = {
+    "generate_speech": handle_generate_speech,
+    "list_voices": handle_list_voices,
+    "get_voice_preview": handle_get_voice_preview,
+    "get_cache_stats": handle_get_cache_stats,
+    "manage_presets": handle_manage_presets,
+    "estimate_speech_info": handle_estimate_speech_info,
+}
 
 
 async def main():
@@ -816,16 +928,28 @@ async def main():
     logger.info("OpenAI TTS MCP Server (Phase 3) starting...")
     
     # 設定の初期化と検証
+    # （設定ファイルとキャッシュ索引の読み込みを最初のリクエストより前に済ませる）
     try:
-        config = get_config()
+        config = await asyncio.to_thread(get_config)
         logger.info(f"Configuration loaded: cache={'enabled' if config.cache_config.enabled else 'disabled'}")
         logger.info(f"Available presets: {len(config.list_presets())}")
     except Exception as e:
         logger.error(f"Failed to load configuration: {e}")
         sys.exit(1)
     
+    if config.cache_config.enabled:
+        try:
+            # TTSClient と同じ引数でキャッシュのシングルトンを生成
+            await asyncio.to_thread(
+                get_cache,
+                max_size=config.cache_config.max_size,
+                ttl_hours=config.cache_config.ttl_hours,
+                cache_dir=config.temp_dir / "cache"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to warm up cache: {e}")
+    
     # 環境変数の確認
-    import os
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         logger.error("OPENAI_API_KEY environment variable is not set")
@@ -833,6 +957,14 @@ async def main():
     
     logger.info("OpenAI API key configured")
     
+    # OpenAI APIへの接続を事前に確立（最初の音声生成でハンドシェイクを待たない）
+    warmup_task = None
+    if config.server_config.warmup_enabled:
+        try:
+            warmup_task = asyncio.create_task(_get_tts_client().warmup())
+        except Exception as e:
+            logger.warning(f"Failed to initialize TTS client for warm-up: {e}")
+    
     try:
         logger.info("Starting MCP server...")
         
@@ -851,12 +983,26 @@ async def main():
     except Exception as e:
         logger.error(f"Failed to start server: {e}", exc_info=True)
         raise
+    
+    finally:
+        if warmup_task is not None:
+            warmup_task.cancel()
+
+        # 共有TTSクライアントの後始末（生成済みの場合のみ）
+        if _tts_client is not None:
+            try:
+                await _tts_client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close TTS client: {e}")
 
 
 if __name__ == "__main__":
     """スクリプト実行時のエントリーポイント"""
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -12,29 +12,93 @@ Phase 3: プロダクション品質対応版
 import asyncio
 import os
 import tempfile
-from datetime import datetime
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Literal, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 
-from openai import AsyncOpenAI
+import httpx
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    AuthenticationError,
+    InternalServerError,
+    RateLimitError,
+)
 import logging
 
+# h2はオプション（インストール時のみHTTP/2で接続）
+try:
+    import h2
+except ImportError:
+    h2 = None
+
 # 内部モジュール
-from config import get_config, TTSPreset
+from config import get_config, TTSPreset, RESPONSE_FORMATS, VoiceType, ResponseFormat, OutputMode
 from cache import get_cache, TTSCacheKey
 from utils import split_long_text, merge_audio_files, normalize_text_for_speech, estimate_speech_duration
 
 logger = logging.getLogger(__name__)
 
-# 型定義
-VoiceType = Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer", "coral"]
-ResponseFormat = Literal["mp3", "opus", "aac", "flac", "wav", "pcm"]
-OutputMode = Literal["file", "play", "both"]
+# 音声データをファイルへ書き込む際のチャンクサイズ
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# OpenAI API用HTTP接続プールの設定（接続を使い回してTLSハンドシェイクを省く）
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY = 60.0
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# 起動時の接続確立（ウォームアップ）リクエストのタイムアウト（秒）
+WARMUP_TIMEOUT = 3.0
+
+# 長文の分割生成で、一時的なエラーにより失敗したチャンクを再試行する回数
+LONG_SPEECH_MAX_RETRIES = 2
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """再試行で回復し得るエラー（レート制限・接続エラー・サーバーエラー）か判定"""
+    cause = error.__cause__ or error
+    if isinstance(cause, RateLimitError):
+        # 利用枠の超過は待っても回復しない
+        return getattr(cause, "code", None) != "insufficient_quota"
+    return isinstance(cause, (APIConnectionError, InternalServerError))
+
+
+def _coalesce_chunks(chunks: List[str], limit: int) -> List[str]:
+    """隣接するチャンクを上限文字数まで空白区切りで連結し、API呼び出し回数を減らす"""
+    packed: List[str] = []
+    current = ""
+    for chunk in chunks:
+        if current and len(current) + 1 + len(chunk) <= limit:
+            current = f"{current} {chunk}"
+        else:
+            if current:
+                packed.append(current)
+            current = chunk
+    if current:
+        packed.append(current)
+    return packed
 
 
 class TTSClient:
     """OpenAI TTS APIクライアント - Phase 3プロダクション版"""
     
+    # サポートされている音声と説明（実行中に変化しないためクラス属性として保持）
+    SUPPORTED_VOICES: Dict[str, str] = {
+        "alloy": "中性的で汎用性の高い音声",
+        "echo": "男性的で深みのある音声", 
+        "fable": "女性的で温かみのある音声",
+        "onyx": "深く落ち着いた男性音声",
+        "nova": "若々しく活発な女性音声",
+        "shimmer": "柔らかく優雅な女性音声",
+        "coral": "明るく親しみやすい女性音声"
+    }
+    
+    # サポートされている出力形式
+    SUPPORTED_FORMATS: List[str] = list(RESPONSE_FORMATS)
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         TTSクライアントを初期化
@@ -42,17 +106,41 @@ class TTSClient:
         Args:
             api_key: OpenAI APIキー。Noneの場合は環境変数から取得
         """
-        # 設定管理の取得
-        self.config = get_config()
+        # 設定管理の取得（頻繁に参照する設定値も属性として保持）
+        self.refresh_config()
         
         # APIキーの設定
         self.api_key = api_key or self.config.openai_api_key
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=httpx.AsyncClient(
+                http2=h2 is not None,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+                ),
+                timeout=HTTP_TIMEOUT
+            )
+        )
+        
+        # ストリーミング応答API（新しいSDKのみ提供）の有無を一度だけ確認して保持
+        speech = self.client.audio.speech
+        self._streaming_create = (
+            speech.with_streaming_response.create
+            if hasattr(speech, "with_streaming_response") else None
+        )
+        
+        # API同時呼び出し数の上限（全リクエストで共有、レート制限対策）
+        self._api_slots = asyncio.Semaphore(max(1, self.config.server_config.max_concurrent_requests))
         self.temp_dir = self.config.get_temp_dir()
         
+        # 生成した一時ファイルと生成時刻（単調時計）を生成順に記録（期限切れ分だけを先頭から削除する）
+        self._created_files: deque[Tuple[str, float]] = deque()
+        
         # キャッシュシステムの初期化
         self.cache = get_cache(
             max_size=self.config.cache_config.max_size,
@@ -62,6 +150,18 @@ class TTSClient:
         
         logger.info(f"TTS Client initialized with cache={'enabled' if self.cache else 'disabled'}")
     
+    def refresh_config(self) -> None:
+        """
+        設定マネージャーを取り直し、頻繁に参照する設定値を再バインド
+        
+        reload_config() で設定を再読み込みした後に呼び出す。
+        """
+        self.config = get_config()
+        server_config = self.config.server_config
+        self._max_text_length = server_config.max_text_length
+        self._split_size = server_config.long_text_split_size
+        self._cleanup_hours = server_config.temp_dir_cleanup_hours
+    
     async def generate_speech(
         self,
         text: str,
@@ -108,7 +208,7 @@ class TTSClient:
         processed_text = normalize_text_for_speech(validated_params["text"])
         
         # 長文チェックと分割
-        if len(processed_text) > self.config.server_config.max_text_length:
+        if len(processed_text) > self._max_text_length:
             logger.info(f"Long text detected ({len(processed_text)} chars), splitting...")
             return await self._generate_long_speech(processed_text, validated_params, enable_cache)
         
@@ -124,7 +224,12 @@ class TTSClient:
         instructions: Optional[str] = None,
         preset: Optional[str] = None,
     ):
-        """Create a streaming speech response for immediate playback."""
+        """
+        Create a streaming speech response for immediate playback.
+
+        Returns an async context manager yielding the response. It holds one of
+        the shared API slots (max_concurrent_requests) while the stream is open.
+        """
         validated_params = self.config.validate_tts_parameters(
             text=text,
             voice=voice,
@@ -151,15 +256,18 @@ class TTSClient:
             "speed": validated_params["speed"],
         }
 
-        try:
-            if hasattr(self.client.audio.speech, "with_streaming_response"):
-                return self.client.audio.speech.with_streaming_response.create(
-                    **api_params
-                )
-        except Exception:
-            pass
-        # Fallback for older versions
-        return await self.client.audio.speech.create(**api_params, stream=True)
+        return self._open_speech_stream(api_params)
+
+    @asynccontextmanager
+    async def _open_speech_stream(self, api_params: Dict[str, Any]):
+        """Open the streaming response while holding an API slot."""
+        async with self._api_slots:
+            if self._streaming_create is not None:
+                async with self._streaming_create(**api_params) as response:
+                    yield response
+            else:
+                # Fallback for older versions
+                yield await self.client.audio.speech.create(**api_params, stream=True)
     
     async def _generate_single_speech(
         self,
@@ -178,8 +286,7 @@ class TTSClient:
         Returns:
             str: 生成された音声ファイルのパス
         """
-        # キャッシュキーの生成
-        cache_key = None
+        # キャッシュ有効時は同一キーの同時生成を1回にまとめる
         if self.cache and enable_cache:
             cache_key = TTSCacheKey(
                 text=text,
@@ -188,13 +295,28 @@ class TTSClient:
                 response_format=params["response_format"],
                 instructions=params.get("instructions")
             )
-            
-            # キャッシュからの取得を試行
-            cached_path = self.cache.get(cache_key)
-            if cached_path:
-                logger.info(f"Cache hit for speech generation")
-                return cached_path
+            return await self.cache.get_or_compute(
+                cache_key,
+                lambda: self._request_speech(text, params)
+            )
+        
+        return await self._request_speech(text, params)
+    
+    async def _request_speech(
+        self,
+        text: str,
+        params: Dict[str, Any]
+    ) -> str:
+        """
+        OpenAI TTS APIを呼び出して音声ファイルを保存
         
+        Args:
+            text: 音声テキスト
+            params: バリデーション済みパラメータ
+            
+        Returns:
+            str: 生成された音声ファイルのパス
+        """
         try:
             # OpenAI TTS API呼び出し準備
             api_params = {
@@ -213,34 +335,52 @@ class TTSClient:
             
             logger.info(f"Generating speech: {len(text)} chars, voice={params['voice']}, speed={params['speed']}")
             
-            # OpenAI TTS API呼び出し
-            response = await self.client.audio.speech.create(**api_params)
-            
-            # 一意なファイル名を生成
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            # 一意なファイル名を生成（ナノ秒時刻＋乱数で並行生成時も衝突しない）
             file_extension = params["response_format"]
-            file_path = self.temp_dir / f"tts_{timestamp}.{file_extension}"
+            file_path = self.temp_dir / f"tts_{time.time_ns():x}_{os.urandom(3).hex()}.{file_extension}"
             
-            # ファイルに保存
-            file_path.write_bytes(response.content)
-            
-            # キャッシュに保存
-            if self.cache and enable_cache and cache_key:
-                self.cache.put(cache_key, str(file_path))
+            # OpenAI TTS API呼び出し（同時呼び出し数はクライアント全体で制限）
+            async with self._api_slots:
+                if self._streaming_create is not None:
+                    # 受信したチャンクを順次ファイルへ書き込む（全体をメモリに保持しない）
+                    try:
+                        async with self._streaming_create(**api_params) as response:
+                            await response.stream_to_file(file_path, chunk_size=STREAM_CHUNK_SIZE)
+                    except BaseException:
+                        file_path.unlink(missing_ok=True)
+                        raise
+                else:
+                    # 旧SDK: レスポンス全体を受信してから保存
+                    response = await self.client.audio.speech.create(**api_params)
+                    await asyncio.to_thread(file_path.write_bytes, response.content)
             
+            self._created_files.append((str(file_path), time.monotonic()))
             logger.info(f"Speech generated: {file_path}")
             return str(file_path)
             
-        except Exception as e:
-            # OpenAI API関連のエラーを適切に処理
-            if "api key" in str(e).lower():
-                raise Exception("OpenAI APIキーが無効です。設定を確認してください。") from e
-            elif "quota" in str(e).lower():
+        except AuthenticationError as e:
+            raise Exception("OpenAI APIキーが無効です。設定を確認してください。") from e
+        except RateLimitError as e:
+            # 利用枠の超過とレート制限はどちらも429で届くため、エラーコードで区別
+            if getattr(e, "code", None) == "insufficient_quota":
                 raise Exception("OpenAI APIの利用制限に達しました。課金設定を確認してください。") from e
-            elif "rate limit" in str(e).lower():
-                raise Exception("OpenAI APIのレート制限に達しました。しばらく待ってから再試行してください。") from e
-            else:
-                raise Exception(f"音声生成中にエラーが発生しました: {str(e)}") from e
+            raise Exception("OpenAI APIのレート制限に達しました。しばらく待ってから再試行してください。") from e
+        except Exception as e:
+            raise Exception(f"音声生成中にエラーが発生しました: {str(e)}") from e
+    
+    def split_text(self, text: str) -> List[str]:
+        """
+        長文を生成単位のチャンクに分割
+        
+        自然な区切りで分割した後、小さな隣接チャンクはAPIの上限文字数までまとめる。
+        
+        Args:
+            text: 分割対象のテキスト
+            
+        Returns:
+            List[str]: API呼び出し1回分ずつのテキストのリスト
+        """
+        return _coalesce_chunks(split_long_text(text, self._split_size), self._max_text_length)
     
     async def _generate_long_speech(
         self,
@@ -260,43 +400,86 @@ class TTSClient:
             List[str]: 生成された音声ファイルのパスリスト
         """
         # テキストを分割
-        text_chunks = split_long_text(text, self.config.server_config.long_text_split_size)
+        text_chunks = self.split_text(text)
         logger.info(f"Text split into {len(text_chunks)} chunks for processing")
         
-        # 分割されたテキストを並行処理
-        file_paths = []
-        
-        # 並行処理での生成（APIレート制限を考慮して適度な並行数）
-        semaphore = asyncio.Semaphore(3)  # 最大3並行
-        
+        # 並行処理での生成（API同時呼び出し数は _request_speech 側で制限）
         async def generate_chunk(chunk_text: str, chunk_index: int) -> str:
-            async with semaphore:
-                try:
-                    logger.debug(f"Processing chunk {chunk_index + 1}/{len(text_chunks)}")
-                    return await self._generate_single_speech(chunk_text, params, enable_cache)
-                except Exception as e:
-                    logger.error(f"Failed to generate chunk {chunk_index + 1}: {e}")
-                    raise
-        
-        # 全チャンクを並行処理
-        tasks = [
-            generate_chunk(chunk, i)
-            for i, chunk in enumerate(text_chunks)
-        ]
-        
-        try:
-            file_paths = await asyncio.gather(*tasks)
-            logger.info(f"Successfully generated {len(file_paths)} audio chunks")
-            return file_paths
+            try:
+                logger.debug(f"Processing chunk {chunk_index + 1}/{len(text_chunks)}")
+                return await self._generate_single_speech(chunk_text, params, enable_cache)
+            except Exception as e:
+                logger.error(f"Failed to generate chunk {chunk_index + 1}: {e}")
+                raise
+        
+        # 全チャンクを並行処理し、一時的なエラーで失敗したチャンクのみ再試行
+        file_paths: List[Optional[str]] = [None] * len(text_chunks)
+        pending = list(range(len(text_chunks)))
+        attempt = 0
+        
+        async def run_round(indices: List[int]) -> List[Tuple[int, BaseException]]:
+            """指定チャンクを並行生成し、失敗したチャンクとエラーを返す
             
-        except Exception as e:
-            # 一部でも失敗した場合は生成済みファイルをクリーンアップ
+            再試行で回復しないエラーが出た時点で残りのチャンクを中止し、無駄なAPI呼び出しを避ける。
+            """
+            tasks = {asyncio.create_task(generate_chunk(text_chunks[i], i)): i for i in indices}
+            failures = []
+            try:
+                running = set(tasks)
+                while running:
+                    done, running = await asyncio.wait(running, return_when=asyncio.FIRST_EXCEPTION)
+                    for task in done:
+                        error = asyncio.CancelledError() if task.cancelled() else task.exception()
+                        if error is None:
+                            file_paths[tasks[task]] = task.result()
+                        else:
+                            failures.append((tasks[task], error))
+                    if running and not all(_is_retryable(e) for _, e in failures):
+                        logger.warning(f"Cancelling {len(running)} remaining chunks after a non-retryable error")
+                        break
+            finally:
+                # 中止時（呼び出し元のキャンセルを含む）は未完了のチャンクを取り消す
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # 取り消しが間に合わず完了していたチャンクの結果も反映（失敗時のクリーンアップ対象にする）
+            for task, i in tasks.items():
+                if file_paths[i] is None and not task.cancelled() and task.exception() is None:
+                    file_paths[i] = task.result()
+            return failures
+        
+        while True:
+            failures = await run_round(pending)
+            
+            if not failures:
+                logger.info(f"Successfully generated {len(file_paths)} audio chunks")
+                return file_paths
+            
+            if attempt >= LONG_SPEECH_MAX_RETRIES or not all(_is_retryable(e) for _, e in failures):
+                break
+            
+            attempt += 1
+            delay = min(2 ** attempt, 30)
+            logger.warning(
+                f"Retrying {len(failures)} failed chunks in {delay}s "
+                f"(attempt {attempt}/{LONG_SPEECH_MAX_RETRIES})"
+            )
+            await asyncio.sleep(delay)
+            pending = [i for i, _ in failures]
+        
+        # 最終的に失敗した場合は生成済みファイルをクリーンアップ
+        # （キャッシュ有効時はキャッシュの保存元/キャッシュファイルのため残す）
+        if not (self.cache and enable_cache):
             for path in file_paths:
-                try:
-                    Path(path).unlink(missing_ok=True)
-                except Exception:
-                    pass
-            raise Exception(f"長文音声生成中にエラーが発生しました: {str(e)}") from e
+                if path:
+                    try:
+                        Path(path).unlink(missing_ok=True)
+                    except Exception:
+                        pass
+        
+        error = failures[0][1]
+        raise Exception(f"長文音声生成中にエラーが発生しました: {str(error)}") from error
     
     def merge_long_speech_files(
         self,
@@ -362,26 +545,18 @@ class TTSClient:
         サポートされている音声一覧と説明を取得
         
         Returns:
-            Dict[str, str]: 音声名と説明のマッピング
+            Dict[str, str]: 音声名と説明のマッピング（共有オブジェクトのため変更しないこと）
         """
-        return {
-            "alloy": "中性的で汎用性の高い音声",
-            "echo": "男性的で深みのある音声", 
-            "fable": "女性的で温かみのある音声",
-            "onyx": "深く落ち着いた男性音声",
-            "nova": "若々しく活発な女性音声",
-            "shimmer": "柔らかく優雅な女性音声",
-            "coral": "明るく親しみやすい女性音声"
-        }
+        return self.SUPPORTED_VOICES
     
     def get_supported_formats(self) -> List[str]:
         """
         サポートされている出力形式一覧を取得
         
         Returns:
-            List[str]: サポートされている出力形式のリスト
+            List[str]: サポートされている出力形式のリスト（共有オブジェクトのため変更しないこと）
         """
-        return ["mp3", "opus", "aac", "flac", "wav", "pcm"]
+        return self.SUPPORTED_FORMATS
     
     def get_preset_info(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -402,6 +577,25 @@ class TTSClient:
             for name, preset in presets.items()
         }
     
+    async def warmup(self) -> None:
+        """
+        OpenAI APIへの接続を事前に確立
+        
+        軽量なリクエストを1回送り、TCP/TLSハンドシェイク済みの接続を接続プールに残す。
+        最初の音声生成がその接続を再利用できるようにするための処理で、失敗しても無視する。
+        """
+        try:
+            await self.client.with_options(timeout=WARMUP_TIMEOUT, max_retries=0).models.list()
+            logger.debug("OpenAI API connection warmed up")
+        except Exception as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+    
+    async def close(self) -> None:
+        """保留中のキャッシュ書き込みを完了させ、APIクライアントの接続を閉じる"""
+        if self.cache:
+            await self.cache.drain()
+        await self.client.close()
+    
     def get_cache_stats(self) -> Optional[Dict[str, Any]]:
         """
         キャッシュ統計情報を取得
@@ -443,29 +637,67 @@ class TTSClient:
             "speech_duration_seconds": speech_duration,
             "estimated_generation_seconds": generation_time,
             "text_length": len(text),
-            "is_long_text": len(text) > self.config.server_config.max_text_length
+            "is_long_text": len(text) > self._max_text_length
         }
     
+    def expire_created_files(self, max_age_hours: int = None) -> int:
+        """
+        このクライアントが生成した一時ファイルのうち、期限切れのものを削除
+        
+        生成順に記録しているため、先頭から期限切れ分だけを取り出して削除する
+        （ディレクトリ全体の走査は不要）。
+        
+        Args:
+            max_age_hours: 削除対象となるファイルの経過時間（時間）
+            
+        Returns:
+            int: 削除したファイル数
+        """
+        max_age_hours = max_age_hours or self._cleanup_hours
+        deadline = time.monotonic() - max_age_hours * 3600
+        
+        cleaned_count = 0
+        while self._created_files and self._created_files[0][1] < deadline:
+            file_path, _ = self._created_files.popleft()
+            try:
+                os.unlink(file_path)
+                cleaned_count += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove temporary file {file_path}: {e}")
+        
+        if cleaned_count > 0:
+            logger.info(f"Cleaned up {cleaned_count} expired temporary files")
+        return cleaned_count
+    
     def cleanup_old_files(self, max_age_hours: int = None):
         """
         古い一時ファイルを削除
         
+        一時ディレクトリ全体を走査するため、以前のプロセスが残したファイルの回収にも使う。
+        
         Args:
             max_age_hours: 削除対象となるファイルの経過時間（時間）
         """
-        max_age_hours = max_age_hours or self.config.server_config.temp_dir_cleanup_hours
+        max_age_hours = max_age_hours or self._cleanup_hours
         
         try:
-            import time
             current_time = time.time()
             max_age_seconds = max_age_hours * 3600
             
+            # scandir の1回の走査で名前・種別・更新時刻を取得（ファイルごとの追加statを省く）
             cleaned_count = 0
-            for file_path in self.temp_dir.glob("tts_*"):
-                if file_path.is_file():
-                    file_age = current_time - file_path.stat().st_mtime
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith("tts_") or not entry.is_file(follow_symlinks=False):
+                        continue
+                    file_age = current_time - entry.stat(follow_symlinks=False).st_mtime
                     if file_age > max_age_seconds:
-                        file_path.unlink()
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            continue
                         cleaned_count += 1
             
             if cleaned_count > 0:
@@ -8,14 +8,53 @@ Phase 3: 高度な機能サポート
 - テキスト前処理
 """
 
+import os
 import re
+import shutil
+import string
+import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ファイル連結でsendfileが使えない場合のコピー単位（ファイル全体をメモリに読み込まない）
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# 音声合成用テキストの抽出結果を保持する件数と、保持対象とする最大文字数
+# （定型文など同じ入力の繰り返しで前処理を省く。長いテキストはメモリを圧迫するため対象外）
+SPEECH_TEXT_CACHE_SIZE = 1024
+SPEECH_TEXT_CACHE_MAX_LENGTH = 4096
+
+# この数以上の音声ファイルを結合する場合はデコードを並行実行する
+PARALLEL_DECODE_MIN_FILES = 4
+
+# ffmpegで再エンコードせずに連結できる出力形式（ヘッダーのないpcmはconcatで読み込めないため除く）
+STREAM_COPY_FORMATS = frozenset({"mp3", "opus", "aac", "flac", "wav"})
+
+# テキスト前処理で使う正規表現（呼び出しごとのパターン解析・キャッシュ検索を避けるため事前にコンパイル）
+_WHITESPACE_RE = re.compile(r'\s+')
+_DUP_PUNCTUATION_RE = re.compile(r'([。！？.!?])\1+')
+# URL・メールアドレス・HTMLタグを1回の走査でまとめて除去する
+_NON_SPEECH_RE = re.compile(
+    r'https?://[^\s]+'                                  # URL
+    # メールアドレス（ローカル部の途中からの照合を除外し、長い英数字列での二乗時間のバックトラックを防ぐ）
+    r'|(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+    r'|<[^>]+>'                                         # HTMLタグ
+)
+# 読み上げない記号
+_SYMBOL_CHARS = '#*_`~[]{}'
+# 英字と空白文字（正規表現の \s と同じくstr.isspace()が真となる文字、最大はU+3000）を削除する変換表
+_NON_JAPANESE_TABLE = str.maketrans('', '', string.ascii_letters + ''.join(
+    c for c in map(chr, range(0x3001)) if c.isspace()
+))
+_ENGLISH_WORD_RE = re.compile(r'[a-zA-Z]+')
+
 
 class TextSplitter:
     """テキスト分割クラス"""
@@ -60,76 +99,92 @@ class TextSplitter:
         
         logger.info(f"Splitting long text: {len(text)} characters")
         
+        # 残りのテキストはコピーせず、元のテキスト上の開始位置で管理する
         chunks = []
-        remaining_text = text
+        start = 0
+        text_length = len(text)
         
-        while remaining_text:
-            if len(remaining_text) <= self.max_length:
-                chunks.append(remaining_text)
+        while start < text_length:
+            if text_length - start <= self.max_length:
+                chunks.append(text[start:])
                 break
             
             # 適切な分割点を見つける
-            split_point = self._find_split_point(remaining_text)
+            split_point = self._find_split_point(text, start)
             
             if split_point == -1:
                 # 自然な分割点が見つからない場合は強制分割
-                split_point = self.max_length
-                logger.warning(f"Forced text split at {split_point} characters")
+                split_point = start + self.max_length
+                logger.warning(f"Forced text split at {self.max_length} characters")
             
-            chunk = remaining_text[:split_point].strip()
+            chunk = text[start:split_point].strip()
             if chunk:
                 chunks.append(chunk)
             
-            remaining_text = remaining_text[split_point:].strip()
+            # 次のチャンク先頭の空白を読み飛ばす
+            start = split_point
+            while start < text_length and text[start].isspace():
+                start += 1
         
         logger.info(f"Text split into {len(chunks)} chunks")
         return chunks
     
-    def _find_split_point(self, text: str) -> int:
+    def _find_split_point(self, text: str, start: int = 0) -> int:
         """
         自然な分割点を見つける
         
         Args:
             text: 検索対象のテキスト
+            start: 検索を開始する位置（この位置からのチャンクの分割点を探す）
             
         Returns:
-            int: 分割点の位置、見つからない場合は-1
+            int: 分割点の位置（textの先頭からの位置）、見つからない場合は-1
         """
-        # 最大長を超えない範囲で検索
-        search_range = min(len(text), self.max_length)
-        search_text = text[:search_range]
+        # 最大長を超えない範囲で検索（部分文字列は作らず、rfindの検索範囲で指定）
+        end = min(len(text), start + self.max_length)
+        # 分割点として許容する最小位置（長さの50%/30%を超える位置）
+        half = start + int(self.max_length * 0.5) + 1
+        third = start + int(self.max_length * 0.3) + 1
         
         # 1. 段落区切りを優先
         for separator in self.PARAGRAPH_SEPARATORS:
-            pos = search_text.rfind(separator)
-            if pos > self.max_length * 0.5:  # 分割点が長さの半分以上の位置
+            pos = text.rfind(separator, half, end)
+            if pos != -1:
                 return pos + len(separator)
         
-        # 2. 文末記号で分割
+        # 2. 文末記号で分割（最も後ろにある文末記号の直後）
         best_pos = -1
+        best_ending = ""
         for ending in self.SENTENCE_ENDINGS:
-            pos = search_text.rfind(ending)
-            if pos > self.max_length * 0.3:  # 分割点が長さの30%以上の位置
-                if pos > best_pos:
-                    best_pos = pos + len(ending)
+            # 見つかっている位置より後ろだけを探す
+            pos = text.rfind(ending, max(third, best_pos + 1), end)
+            if pos != -1:
+                best_pos = pos
+                best_ending = ending
         
         if best_pos > -1:
-            return best_pos
+            return best_pos + len(best_ending)
         
         # 3. 改行で分割
-        pos = search_text.rfind('\n')
-        if pos > self.max_length * 0.3:
+        pos = text.rfind('\n', third, end)
+        if pos != -1:
             return pos + 1
         
         # 4. 単語境界で分割（スペースやカンマ）
         for delimiter in [', ', '、', ' ']:
-            pos = search_text.rfind(delimiter)
-            if pos > self.max_length * 0.5:
+            pos = text.rfind(delimiter, half, end)
+            if pos != -1:
                 return pos + len(delimiter)
         
         return -1
 
 
+@lru_cache(maxsize=1)
+def _find_ffmpeg() -> Optional[str]:
+    """ffmpegの実行ファイルのパスを取得（見つからない場合はNone）"""
+    return shutil.which("ffmpeg")
+
+
 class AudioFileMerger:
     """音声ファイル結合クラス"""
     
@@ -163,29 +218,33 @@ class AudioFileMerger:
         if len(file_paths) == 1:
             return file_paths[0]
         
+        # 全ファイルが出力と同じ形式なら、ffmpegでデコード・再エンコードせずに連結
+        if output_format in STREAM_COPY_FORMATS and all(
+            Path(file_path).suffix[1:].lower() == output_format for file_path in file_paths
+        ):
+            output_path = self._output_path(output_dir, "merged", output_format)
+            if self._stream_copy_concatenate(file_paths, output_path):
+                logger.info(f"Audio files merged without re-encoding: {output_path}")
+                return str(output_path)
+        
         try:
             # pydubを使用して音声ファイルを結合
             from pydub import AudioSegment
             
             logger.info(f"Merging {len(file_paths)} audio files")
             
-            # 最初のファイルを読み込み
-            combined = AudioSegment.from_file(file_paths[0])
-            
-            # 他のファイルを順次結合
-            for file_path in file_paths[1:]:
-                audio = AudioSegment.from_file(file_path)
-                combined += audio
-            
-            # 出力ファイル名を生成
-            output_dir = output_dir or Path(tempfile.gettempdir()) / "openai_tts_mcp"
-            output_dir.mkdir(exist_ok=True)
-            
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            output_path = output_dir / f"merged_{timestamp}.{output_format}"
+            # 全ファイルを読み込んでから一度に結合
+            # （デコードはffmpegの子プロセスで行われGILを解放するため、ファイル数が多い場合はスレッドで並行実行）
+            if len(file_paths) >= PARALLEL_DECODE_MIN_FILES:
+                max_workers = min(len(file_paths), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    segments = list(executor.map(AudioSegment.from_file, file_paths))
+            else:
+                segments = [AudioSegment.from_file(file_path) for file_path in file_paths]
+            combined = self._concatenate_segments(AudioSegment, segments)
             
             # ファイルを出力
+            output_path = self._output_path(output_dir, "merged", output_format)
             combined.export(str(output_path), format=output_format)
             
             logger.info(f"Audio files merged: {output_path}")
@@ -200,6 +259,94 @@ class AudioFileMerger:
             logger.error(f"Failed to merge audio files: {e}")
             raise Exception(f"音声ファイルの結合に失敗しました: {str(e)}") from e
     
+    @cached_property
+    def default_output_dir(self) -> Path:
+        """既定の出力ディレクトリ（初回アクセス時に作成）"""
+        output_dir = Path(tempfile.gettempdir()) / "openai_tts_mcp"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+    
+    def _output_path(self, output_dir: Optional[Path], prefix: str, output_format: str) -> Path:
+        """出力ファイルのパスを生成（指定された出力ディレクトリがなければ作成）"""
+        if output_dir is None:
+            output_dir = self.default_output_dir
+        else:
+            output_dir.mkdir(exist_ok=True)
+        
+        # ナノ秒時刻＋乱数で一意なファイル名を生成（並行して結合しても衝突しない）
+        return output_dir / f"{prefix}_{time.time_ns():x}_{os.urandom(3).hex()}.{output_format}"
+    
+    @staticmethod
+    def _stream_copy_concatenate(file_paths: List[str], output_path: Path) -> bool:
+        """
+        ffmpegのconcatデマルチプレクサで音声ファイルをストリームコピーで連結
+        
+        デコード・再エンコードを行わないため、pydubでの結合より高速でメモリも少ない。
+        
+        Returns:
+            bool: 連結できた場合はTrue（ffmpegがない・失敗した場合はFalse）
+        """
+        ffmpeg = _find_ffmpeg()
+        if ffmpeg is None:
+            return False
+        
+        list_path = output_path.with_suffix(".txt")
+        try:
+            # concatの入力リスト（パス中のシングルクォートはエスケープ）
+            with open(list_path, 'w', encoding='utf-8') as list_file:
+                for file_path in file_paths:
+                    escaped = str(Path(file_path).resolve()).replace("'", "'\\''")
+                    list_file.write(f"file '{escaped}'\n")
+            
+            result = subprocess.run(
+                [
+                    ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+                    "-f", "concat", "-safe", "0", "-i", str(list_path),
+                    "-c", "copy", str(output_path)
+                ],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode == 0:
+                return True
+            
+            logger.warning(f"ffmpeg stream copy failed, falling back to re-encoding: {result.stderr.strip()}")
+        except OSError as e:
+            logger.warning(f"ffmpeg stream copy failed, falling back to re-encoding: {e}")
+        finally:
+            list_path.unlink(missing_ok=True)
+        
+        output_path.unlink(missing_ok=True)
+        return False
+    
+    @staticmethod
+    def _concatenate_segments(audio_segment_class, segments: list):
+        """
+        AudioSegmentを順に連結
+        
+        += の繰り返しは結合のたびにそれまでのサンプルデータ全体をコピーする（O(n²)）ため、
+        + と同じく形式（チャンネル数・フレームレート・サンプル幅）を最大値に揃えた上で、
+        サンプルデータを1回のjoinで連結する。
+        """
+        channels = max(segment.channels for segment in segments)
+        frame_rate = max(segment.frame_rate for segment in segments)
+        sample_width = max(segment.sample_width for segment in segments)
+        
+        # set_* は形式が同じならそのまま返すため、揃っている場合はコピーしない
+        raw_data = b"".join(
+            segment.set_channels(channels)
+            .set_frame_rate(frame_rate)
+            .set_sample_width(sample_width)
+            .raw_data
+            for segment in segments
+        )
+        return audio_segment_class(
+            data=raw_data,
+            sample_width=sample_width,
+            frame_rate=frame_rate,
+            channels=channels
+        )
+    
     def _simple_concatenate(
         self,
         file_paths: List[str],
@@ -211,22 +358,47 @@ class AudioFileMerger:
         
         注意: これは正式な音声結合ではなく、緊急用のフォールバック
         """
-        output_dir = output_dir or Path(tempfile.gettempdir()) / "openai_tts_mcp"
-        output_dir.mkdir(exist_ok=True)
-        
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        output_path = output_dir / f"concatenated_{timestamp}.{output_format}"
+        output_path = self._output_path(output_dir, "concatenated", output_format)
         
-        with open(output_path, 'wb') as output_file:
+        # 非バッファで開き、sendfileによる追記と通常の書き込みで書き込み位置がずれないようにする
+        with open(output_path, 'wb', buffering=0) as output_file:
             for file_path in file_paths:
-                with open(file_path, 'rb') as input_file:
-                    output_file.write(input_file.read())
+                _append_file(file_path, output_file)
         
         logger.warning(f"Files concatenated (not properly merged): {output_path}")
         return str(output_path)
 
 
+def _append_file(file_path: str, output_file) -> None:
+    """
+    ファイルの内容を出力ファイルの末尾に追記
+    
+    sendfileでカーネル内コピーし（ファイル全体をメモリに読み込まない）、
+    利用できない環境では通常のチャンクコピーに切り替える。
+    """
+    with open(file_path, 'rb') as input_file:
+        input_fd, output_fd = input_file.fileno(), output_file.fileno()
+        size = os.fstat(input_fd).st_size
+        start = output_file.tell()
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(output_fd, input_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            if offset == size:
+                return
+        except (OSError, AttributeError):
+            pass
+        # 非Linux環境や途中で0が返った場合は書き込み済みの分を戻して通常コピー
+        output_file.seek(start)
+        output_file.truncate()
+        
+        input_file.seek(0)
+        shutil.copyfileobj(input_file, output_file, COPY_BUFFER_SIZE)
+
+
 class TextProcessor:
     """テキスト前処理クラス"""
     
@@ -245,15 +417,10 @@ class TextProcessor:
             return ""
         
         # 空白文字の正規化
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WHITESPACE_RE.sub(' ', text.strip())
         
-        # 連続する句読点の正規化
-        text = re.sub(r'[。]{2,}', '。', text)
-        text = re.sub(r'[！]{2,}', '！', text)
-        text = re.sub(r'[？]{2,}', '？', text)
-        text = re.sub(r'[.]{2,}', '.', text)
-        text = re.sub(r'[!]{2,}', '!', text)
-        text = re.sub(r'[?]{2,}', '?', text)
+        # 連続する句読点の正規化（同じ記号の連続を1つにまとめる、1回の走査で全種類を処理）
+        text = _DUP_PUNCTUATION_RE.sub(r'\1', text)
         
         return text
     
@@ -262,28 +429,32 @@ class TextProcessor:
         """
         音声合成に適したテキストを抽出
         
+        入力のみで結果が決まるため、一定の長さまでのテキストは結果をメモ化する。
+        
         Args:
             text: 元のテキスト
             
         Returns:
             str: 音声合成用に最適化されたテキスト
         """
-        # URLの除去
-        text = re.sub(r'https?://[^\s]+', '', text)
-        
-        # メールアドレスの除去
-        text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', text)
-        
-        # HTMLタグの除去
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # マークダウン記法の簡素化
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # 太字
-        text = re.sub(r'\*(.*?)\*', r'\1', text)      # 斜体
-        text = re.sub(r'`(.*?)`', r'\1', text)        # コード
-        
-        # 余分な記号の除去
-        text = re.sub(r'[#*_`~\[\]{}]', '', text)
+        if len(text) <= SPEECH_TEXT_CACHE_MAX_LENGTH:
+            return _extract_speech_text_cached(text)
+        return TextProcessor._extract_speech_text(text)
+    
+    @staticmethod
+    def _extract_speech_text(text: str) -> str:
+        """音声合成に適したテキストを抽出（メモ化なし）"""
+        # URL・メールアドレス・HTMLタグの除去
+        # （いずれも必ず含む文字列を先に確認し、該当しないテキストでは正規表現の走査を省く）
+        if '://' in text or '@' in text or '<' in text:
+            text = _NON_SPEECH_RE.sub('', text)
+        
+        # マークダウン記法（太字・斜体・コードの * と `）と余分な記号の除去
+        # 記号は内容を残して文字単位で削除するため、記法ごとの置換は不要
+        # （str.translateは非ASCII文字を含むと1文字ずつ辞書を引くため、含まれる記号のみreplaceで削除）
+        for symbol in _SYMBOL_CHARS:
+            if symbol in text:
+                text = text.replace(symbol, '')
         
         return TextProcessor.normalize_text(text)
     
@@ -300,8 +471,8 @@ class TextProcessor:
             float: 推定再生時間（秒）
         """
         # 日本語: 約400文字/分、英語: 約150単語/分
-        japanese_chars = len(re.sub(r'[a-zA-Z\s]', '', text))
-        english_words = len(re.findall(r'[a-zA-Z]+', text))
+        japanese_chars = len(text.translate(_NON_JAPANESE_TABLE))
+        english_words = len(_ENGLISH_WORD_RE.findall(text))
         
         # 推定時間（分）
         japanese_minutes = japanese_chars / 400
@@ -316,6 +487,15 @@ class TextProcessor:
         return max(adjusted_seconds, 1.0)  # 最低1秒
 
 
+_extract_speech_text_cached = lru_cache(maxsize=SPEECH_TEXT_CACHE_SIZE)(TextProcessor._extract_speech_text)
+
+
+@lru_cache(maxsize=16)
+def _get_splitter(max_length: int) -> TextSplitter:
+    """最大文字数ごとのテキスト分割器を取得（状態を持たないため使い回す）"""
+    return TextSplitter(max_length)
+
+
 def split_long_text(text: str, max_length: int = 4000) -> List[str]:
     """
     長いテキストを分割（便利関数）
@@ -327,8 +507,11 @@ def split_long_text(text: str, max_length: int = 4000) -> List[str]:
     Returns:
         List[str]: 分割されたテキストのリスト
     """
-    splitter = TextSplitter(max_length)
-    return splitter.split_text(text)
+    return _get_splitter(max_length).split_text(text)
+
+
+# 音声ファイル結合器（状態を持たないため共有）
+_audio_file_merger = AudioFileMerger()
 
 
 def merge_audio_files(
@@ -347,8 +530,7 @@ def merge_audio_files(
     Returns:
         str: 結合された音声ファイルのパス
     """
-    merger = AudioFileMerger()
-    return merger.merge_audio_files(file_paths, output_format, output_dir)
+    return _audio_file_merger.merge_audio_files(file_paths, output_format, output_dir)
 
 
 def normalize_text_for_speech(text: str) -> str:
@@ -361,8 +543,7 @@ def normalize_text_for_speech(text: str) -> str:
     Returns:
         str: 正規化されたテキスト
     """
-    processor = TextProcessor()
-    return processor.extract_speech_text(text)
+    return TextProcessor.extract_speech_text(text)
 
 
 def estimate_speech_duration(text: str, speed: float = 1.0) -> float:
@@ -376,5 +557,4 @@ def estimate_speech_duration(text: str, speed: float = 1.0) -> float:
     Returns:
         float: 推定再生時間（秒）
     """
-    processor = TextProcessor()
-    return processor.estimate_speech_duration(text, speed)
+    return TextProcessor.estimate_speech_duration(text, speed)
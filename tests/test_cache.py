@@ -0,0 +1,116 @@
+"""
+TTSキャッシュのテスト
+
+実行方法: python -m unittest discover -s tests
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cache import ORPHAN_GRACE_SECONDS, TTSCache, TTSCacheKey
+
+
+class GetOrComputeTest(unittest.IsolatedAsyncioTestCase):
+    """get_or_compute の単一実行（single-flight）のテスト"""
+
+    async def asyncSetUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.work_dir = Path(self._temp_dir.name)
+        self.cache = TTSCache(cache_dir=self.work_dir / "cache")
+        self.cache_key = TTSCacheKey("こんにちは", "alloy", 1.0, "mp3")
+        self.calls = 0
+
+    async def asyncTearDown(self):
+        await self.cache.drain()
+        self.cache._close_journal()
+        self._temp_dir.cleanup()
+
+    async def _compute(self) -> str:
+        """生成を模したコルーチン（呼び出し回数を記録）"""
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        file_path = self.work_dir / f"speech_{self.calls}.mp3"
+        file_path.write_bytes(b"audio")
+        return str(file_path)
+
+    async def test_concurrent_same_key_computes_once(self):
+        results = await asyncio.gather(
+            self.cache.get_or_compute(self.cache_key, self._compute),
+            self.cache.get_or_compute(self.cache_key, self._compute),
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results[0], results[1])
+
+    async def test_entry_is_registered_before_inflight_is_cleared(self):
+        await self.cache.get_or_compute(self.cache_key, self._compute)
+        # 生成完了直後の同一キー呼び出しは、ライターの処理を待たずにキャッシュヒットする
+        cached_path = await self.cache.get_or_compute(self.cache_key, self._compute)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(Path(cached_path).exists())
+
+
+class PersistenceTest(unittest.TestCase):
+    """メタデータの永続化と起動時のクリーンアップのテスト"""
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.work_dir = Path(self._temp_dir.name)
+        self.cache_dir = self.work_dir / "cache"
+        self._caches = []
+
+    def tearDown(self):
+        for cache in self._caches:
+            cache._close_journal()
+        self._temp_dir.cleanup()
+
+    def _open_cache(self) -> TTSCache:
+        cache = TTSCache(cache_dir=self.cache_dir)
+        self._caches.append(cache)
+        return cache
+
+    def _put(self, cache: TTSCache, text: str) -> TTSCacheKey:
+        cache_key = TTSCacheKey(text, "alloy", 1.0, "mp3")
+        source = self.work_dir / f"{text}.mp3"
+        source.write_bytes(b"audio")
+        cache.put(cache_key, str(source))
+        return cache_key
+
+    def test_partial_journal_record_is_truncated_on_load(self):
+        first_key = self._put(self._open_cache(), "first")
+        journal_file = self.cache_dir / "cache_metadata.jsonl"
+        with open(journal_file, "ab") as f:
+            f.write(b'{"op": "put", "k": "trunc')
+
+        # 書きかけ行を除去した後に追記したレコードが、次回の読み込みで失われない
+        second_key = self._put(self._open_cache(), "second")
+        reloaded = self._open_cache()
+        self.assertIsNotNone(reloaded.get(first_key))
+        self.assertIsNotNone(reloaded.get(second_key))
+        self.assertTrue(journal_file.read_bytes().endswith(b"\n"))
+
+    def test_orphan_sweep_skips_recent_files(self):
+        self._open_cache()
+        old_orphan = self.cache_dir / ("a" * 32 + ".mp3")
+        new_orphan = self.cache_dir / ("b" * 32 + ".mp3")
+        unrelated = self.cache_dir / "notes.txt"
+        for path in (old_orphan, new_orphan, unrelated):
+            path.write_bytes(b"data")
+        expired = time.time() - ORPHAN_GRACE_SECONDS - 60
+        os.utime(old_orphan, (expired, expired))
+        os.utime(unrelated, (expired, expired))
+
+        self._open_cache()
+        self.assertFalse(old_orphan.exists())
+        self.assertTrue(new_orphan.exists())
+        self.assertTrue(unrelated.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()